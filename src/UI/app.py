@@ -2,35 +2,99 @@
 
 import streamlit as st
 from streamlit_option_menu import option_menu
-import time
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from pathlib import Path
 
 # Import your existing components
 from src.agent import JobSearchAgent
 from src.google_drive_handler import GoogleDriveHandler
-from src.document_store import DocumentStore
 from src.config import get_settings
 from src.logger import get_logger, set_logger, AgentLogger
 from src.callbacks import StreamingCallbackHandler
-from src.state import AgentState
+from src.enhanced_resume_parser import EnhancedResumeParser
+from src.resume_parser import ResumeTextExtractor
+from src.state import AgentState, ParsedResume, JobRoleMatch, ResumeSummary
+from langchain_core.messages import HumanMessage
 from langchain_ollama import ChatOllama
+from pydantic import TypeAdapter
+from collections import defaultdict
 
-from src.UI.streaming_utils import StreamlitTokenHandler, create_analysis_section, show_streaming_progress
-from pathlib import Path
+from src.UI.streaming_utils import (
+    StreamlitTokenHandler,
+    create_analysis_section,
+    show_streaming_progress
+)
+from src.utils import quick_fingerprint, staging_path
+from src.UI.resources import get_doc_store
 
 # Import UI components
 from src.UI.components.results import render_results
 from src.UI.components.cache_viewer import render_cache_stats
 
 
+# Static page chrome - built once at import time instead of on every rerun
+_HEADER_HTML = """
+    <div style='text-align: center; padding: 2rem 0;'>
+        <h1 style='color: #1E3A8A; font-size: 3rem; margin-bottom: 0;'>
+            🚀 Ascend
+        </h1>
+        <p style='color: #64748B; font-size: 1.2rem; margin-top: 0.5rem;'>
+            AI-Powered Resume Analysis & Job Matching Platform
+        </p>
+    </div>
+"""
+
+# Validates a whole cached job-roles list in one pydantic-core call
+# instead of N per-element model_validate round-trips
+_JOB_MATCHES_TA = TypeAdapter(list[JobRoleMatch])
+
+# Single-flight registry: concurrent analyses of the same Drive file
+# (two tabs, a double-click) coalesce into one pipeline run
+_inflight: dict = {}
+_inflight_lock = threading.Lock()
+
+# Upper bound a waiter blocks on another session's run before assuming
+# that run died and analyzing the resume itself (a full pipeline run can
+# legitimately take ~15 minutes)
+_INFLIGHT_WAIT_S = 30 * 60
+
+_MENU_STYLES = {
+    "container": {"padding": "0!important", "background-color": "#F8FAFC"},
+    "icon": {"color": "#3B82F6", "font-size": "20px"},
+    "nav-link": {
+        "font-size": "16px",
+        "text-align": "center",
+        "margin": "0px",
+        "--hover-color": "#E0E7FF",
+    },
+    "nav-link-selected": {"background-color": "#3B82F6"},
+}
+
+
+@st.cache_resource
+def get_agent(model_name: str = None):
+    """Build the JobSearchAgent once per process (per model).
+
+    session_state is per-browser-session, so guarding init there still
+    re-imports langchain/langgraph and rebuilds the graph on every refresh;
+    cache_resource shares the singleton across sessions and reruns. The
+    agent's Drive handler, text extractor, and ChatOllama client (with
+    its pooled HTTP connections) are all reused with it.
+    """
+    return JobSearchAgent(model_name)
+
+
 def init_session_state():
     """Initialize session state variables."""
     if 'processed_resume' not in st.session_state:
         st.session_state.processed_resume = None
     if 'selected_file' not in st.session_state:
         st.session_state.selected_file = None
-    if 'agent' not in st.session_state:
-        st.session_state.agent = None
     if 'drive_handler' not in st.session_state:
         st.session_state.drive_handler = None
     if 'enable_skill_gap' not in st.session_state:
@@ -94,16 +158,7 @@ def main():
     load_custom_css()
     
     # Header
-    st.markdown("""
-        <div style='text-align: center; padding: 2rem 0;'>
-            <h1 style='color: #1E3A8A; font-size: 3rem; margin-bottom: 0;'>
-                🚀 Ascend
-            </h1>
-            <p style='color: #64748B; font-size: 1.2rem; margin-top: 0.5rem;'>
-                AI-Powered Resume Analysis & Job Matching Platform
-            </p>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
     
     st.divider()
     
@@ -115,17 +170,7 @@ def main():
         menu_icon="cast",
         default_index=0,
         orientation="horizontal",
-        styles={
-            "container": {"padding": "0!important", "background-color": "#F8FAFC"},
-            "icon": {"color": "#3B82F6", "font-size": "20px"}, 
-            "nav-link": {
-                "font-size": "16px",
-                "text-align": "center",
-                "margin": "0px",
-                "--hover-color": "#E0E7FF",
-            },
-            "nav-link-selected": {"background-color": "#3B82F6"},
-        }
+        styles=_MENU_STYLES
     )
     
     # Render selected page
@@ -198,29 +243,50 @@ def render_upload_page():
         """)
 
 
+@st.fragment
 def render_local_upload():
-    """Handle local file upload."""
+    """Handle local file upload.
+
+    Runs as a fragment so the analyze/streaming flow reruns independently,
+    without re-executing the menu, CSS injection, and page layout.
+    """
     uploaded_file = st.file_uploader(
         "Choose a resume file",
         type=['pdf', 'docx'],
         help="Upload your resume in PDF or DOCX format"
     )
-    
+
     if uploaded_file is not None:
         st.success(f"✅ File uploaded: {uploaded_file.name}")
-        
-        # Save uploaded file temporarily
-        temp_path = Path(f"temp_resumes/{uploaded_file.name}")
-        temp_path.parent.mkdir(exist_ok=True)
-        
-        with open(temp_path, 'wb') as f:
-            f.write(uploaded_file.getbuffer())
-        
+
+        # Drop the temp file from the previous rerun (if any) before staging a new one
+        prev_tmp = st.session_state.pop('_local_upload_tmp', None)
+        if prev_tmp:
+            Path(prev_tmp).unlink(missing_ok=True)
+
+        # Stage upload in the OS temp dir (tmpfs on most hosts) under a unique
+        # name, so same-name uploads can't collide and orphans don't fill the
+        # project directory
+        fd, temp_path_str = tempfile.mkstemp(
+            suffix=Path(uploaded_file.name).suffix,
+            dir=os.getenv('TMP_UPLOAD_DIR') or tempfile.gettempdir()
+        )
+        with os.fdopen(fd, 'wb') as f:
+            shutil.copyfileobj(uploaded_file, f)
+
+        st.session_state['_local_upload_tmp'] = temp_path_str
+
+        @st.fragment
+        def _run_analysis(file_path: str, file_name: str):
+            """Isolate Phase 1/2 streaming so widget interactions elsewhere don't reset it."""
+            analyze_local_resume(file_path, file_name)
+
         if st.button("🚀 Analyze Resume", type="primary", use_container_width=True):
-            analyze_local_resume(str(temp_path), uploaded_file.name)  # NEW: Use streaming function
+            _run_analysis(temp_path_str, uploaded_file.name)  # NEW: Use streaming function
 
 
 
+@st.fragment
 def render_drive_upload():
     """Handle Google Drive file selection."""
     
@@ -311,18 +377,7 @@ def analyze_local_resume(file_path: str, file_name: str):
         file_path: Path to locally uploaded resume file
         file_name: Original filename
     """
-    
-    from src.UI.streaming_utils import (
-        StreamlitTokenHandler, 
-        create_analysis_section, 
-        show_streaming_progress,
-        simulate_streaming_from_cache
-    )
-    from pathlib import Path
-    from src.document_store import DocumentStore
-    from src.utils import hash_file
-    import time
-    
+
     # Create progress indicators
     progress_placeholder = st.empty()
     status_placeholder = st.empty()
@@ -355,12 +410,9 @@ def analyze_local_resume(file_path: str, file_name: str):
             progress_placeholder
         )
         
-        if st.session_state.agent is None:
-            from src.agent import JobSearchAgent
-            st.session_state.agent = JobSearchAgent()
-        
-        time.sleep(0.3)
-        
+        agent = get_agent()
+
+
         # ========== STEP 2: Compute Hash & Check Cache ==========
         show_streaming_progress(
             "Computing resume hash & checking cache",
@@ -371,8 +423,8 @@ def analyze_local_resume(file_path: str, file_name: str):
         
         parsing_container.info(f"📄 Processing: {file_name}")
         
-        resume_hash = hash_file(file_path)
-        doc_store = DocumentStore()
+        resume_hash = quick_fingerprint(file_path)
+        doc_store = get_doc_store()
         cached_data = doc_store.get_cached_resume(resume_hash)
         
         # Variables to store Phase 1 results
@@ -380,6 +432,7 @@ def analyze_local_resume(file_path: str, file_name: str):
         job_matches = None
         summary = None
         raw_text = None
+        jobs_future = None  # Background Phase 2 job fetch (cache-miss path)
         
         # ========== CACHE HIT PATH (Load Phase 1 from cache) ==========
         if cached_data:
@@ -387,10 +440,8 @@ def analyze_local_resume(file_path: str, file_name: str):
             st.info("⚡ Loading cached Phase 1 results... Phase 2 will still run with live data")
             
             # Parse cached data
-            from src.state import ParsedResume, JobRoleMatch, ResumeSummary
-            
             parsed_resume = ParsedResume.model_validate(cached_data['parsed_data'])
-            job_matches = [JobRoleMatch.model_validate(m) for m in cached_data['job_roles']]
+            job_matches = _JOB_MATCHES_TA.validate_python(cached_data['job_roles'])
             summary = ResumeSummary.model_validate(cached_data['summary'])
             
             # ===== Parsing Section =====
@@ -409,52 +460,47 @@ def analyze_local_resume(file_path: str, file_name: str):
             # ===== Job Roles Section (Simulated Streaming) =====
             show_streaming_progress("Simulating job role analysis (cached)", 50, status_placeholder, progress_placeholder)
             
-            roles_text = "**Top 3 Job Role Recommendations:**\n\n"
-            for idx, match in enumerate(job_matches, 1):
-                roles_text += f"**{idx}. {match.role_title}**\n"
-                roles_text += f"- **Confidence:** {match.confidence_score:.1%}\n"
-                roles_text += f"- **Reasoning:** {match.reasoning}\n"
-                roles_text += f"- **Matching Skills:** {', '.join(match.key_matching_skills[:5])}\n\n"
-            
-            simulate_streaming_from_cache(
-                roles_container,
-                roles_text,
-                prefix="📦 Cached Analysis",
-                chars_per_token=8,
-                delay_ms=20
+            roles_text = "**Top 3 Job Role Recommendations:**\n\n" + "\n".join(
+                f"**{idx}. {match.role_title}**\n"
+                f"- **Confidence:** {match.confidence_score:.1%}\n"
+                f"- **Reasoning:** {match.reasoning}\n"
+                f"- **Matching Skills:** {', '.join(match.key_matching_skills[:5])}\n"
+                for idx, match in enumerate(job_matches, 1)
             )
             
+            # Cached text renders in one shot - no fake typewriter sleeps
+            roles_container.markdown(f"**📦 Cached Analysis**\n\n{roles_text}")
+
             roles_container.success("✅ Job role analysis complete (from cache)")
             
             # ===== Summary Section (Simulated Streaming) =====
             show_streaming_progress("Simulating quality assessment (cached)", 70, status_placeholder, progress_placeholder)
             
-            summary_text = f"**Quality Score:** {summary.quality_score}/10\n\n"
-            summary_text += f"**Summary:**\n{summary.overall_summary}\n\n"
-            summary_text += f"**Years of Experience:** {summary.years_of_experience or 'N/A'}\n\n"
-            summary_text += f"**Key Strengths:**\n"
-            summary_text += '\n'.join([f"- {s}" for s in summary.key_strengths]) + "\n\n"
-            summary_text += f"**Improvement Suggestions:**\n"
-            summary_text += '\n'.join([f"- {s}" for s in summary.improvement_suggestions])
-            
+            summary_parts = [
+                f"**Quality Score:** {summary.quality_score}/10\n",
+                f"**Summary:**\n{summary.overall_summary}\n",
+                f"**Years of Experience:** {summary.years_of_experience or 'N/A'}\n",
+                "**Key Strengths:**\n" + '\n'.join(f"- {s}" for s in summary.key_strengths) + "\n",
+                "**Improvement Suggestions:**\n" + '\n'.join(f"- {s}" for s in summary.improvement_suggestions),
+            ]
+
             if summary.grammatical_issues:
-                summary_text += f"\n\n**Grammatical Issues:**\n"
-                summary_text += '\n'.join([f"- {i}" for i in summary.grammatical_issues])
-            
-            simulate_streaming_from_cache(
-                summary_container,
-                summary_text,
-                prefix="📦 Cached Assessment",
-                chars_per_token=8,
-                delay_ms=20
-            )
+                summary_parts.append(
+                    "**Grammatical Issues:**\n" + '\n'.join(f"- {i}" for i in summary.grammatical_issues)
+                )
+
+            summary_text = "\n".join(summary_parts)
             
+            summary_container.markdown(f"**📦 Cached Assessment**\n\n{summary_text}")
+
             summary_container.success("✅ Quality assessment complete (from cache)")
             
-            # Need raw_text for Phase 2, extract it
-            from src.resume_parser import ResumeTextExtractor
-            text_extractor = ResumeTextExtractor()
-            raw_text = text_extractor.extract_text(file_path)
+            # Need raw_text for Phase 2 - prefer the cached copy, only
+            # re-run pdfplumber for rows cached before raw_text was stored
+            raw_text = cached_data.get('raw_text')
+            if not raw_text:
+                text_extractor = ResumeTextExtractor()
+                raw_text = text_extractor.extract_text(file_path)
         
         # ========== CACHE MISS PATH (Run Phase 1 with LLM) ==========
         else:
@@ -463,15 +509,13 @@ def analyze_local_resume(file_path: str, file_name: str):
             # ===== Parse Resume =====
             show_streaming_progress("Parsing resume structure (PDFPlumber)", 30, status_placeholder, progress_placeholder)
             
-            from src.enhanced_resume_parser import EnhancedResumeParser
-            from src.resume_parser import ResumeTextExtractor
-            
             parser = EnhancedResumeParser(file_path=file_path, debug=False)
             parsed_resume = parser.parse()
-            
-            text_extractor = ResumeTextExtractor()
-            raw_text = text_extractor.extract_text(file_path)
-            
+
+            # parse() already extracted the text - no second pdfplumber pass
+            raw_text = parser.raw_text
+
+
             parsing_container.success("✅ Resume parsed successfully")
             parsing_container.markdown(f"""
             **Extracted Information:**
@@ -485,9 +529,6 @@ def analyze_local_resume(file_path: str, file_name: str):
             # ===== Analyze Job Roles with REAL LLM STREAMING =====
             show_streaming_progress("Analyzing job role fit (LLM streaming - ~6 minutes)", 50, status_placeholder, progress_placeholder)
             
-            from src.state import AgentState
-            from langchain_core.messages import HumanMessage
-            
             current_state = {
                 'messages': [HumanMessage(content=f"Processing {file_name}")],
                 'file_id': 'local',
@@ -505,14 +546,13 @@ def analyze_local_resume(file_path: str, file_name: str):
                 prefix="🤖 AI Analysis in Progress (Live Streaming)..."
             )
             
-            roles_result = st.session_state.agent._analyze_job_roles_streaming(
+            roles_result = agent._analyze_job_roles_streaming(
                 current_state,
                 token_callback=roles_handler.on_token
             )
             
             if roles_result.get('error'):
                 roles_container.error(f"❌ Analysis failed: {roles_result['error']}")
-                doc_store.close()
                 return
             
             roles_handler.clear()
@@ -527,6 +567,22 @@ def analyze_local_resume(file_path: str, file_name: str):
                 - **Matching Skills:** {', '.join(match.key_matching_skills[:5])}
                 """)
             
+            # Kick off the Phase 2 job fetch now - it only depends on
+            # job_matches, so it can overlap with the ~8 minute summary stream
+            if st.session_state.enable_skill_gap:
+                fetch_state = {
+                    'messages': [],
+                    'file_id': 'local',
+                    'file_name': file_name,
+                    'parsed_resume': parsed_resume,
+                    'job_role_matches': job_matches,
+                    'resume_hash': resume_hash,
+                    'enable_skill_gap': True
+                }
+                jobs_future = ThreadPoolExecutor(max_workers=1).submit(
+                    agent._fetch_job_postings, fetch_state
+                )
+
             # ===== Generate Summary with REAL LLM STREAMING =====
             show_streaming_progress("Generating quality assessment (LLM streaming - ~8 minutes)", 70, status_placeholder, progress_placeholder)
             
@@ -538,14 +594,13 @@ def analyze_local_resume(file_path: str, file_name: str):
                 prefix="🤖 AI Review in Progress (Live Streaming)..."
             )
             
-            summary_result = st.session_state.agent._generate_summary_streaming(
+            summary_result = agent._generate_summary_streaming(
                 current_state,
                 token_callback=summary_handler.on_token
             )
             
             if summary_result.get('error'):
                 summary_container.error(f"❌ Summary failed: {summary_result['error']}")
-                doc_store.close()
                 return
             
             summary_handler.clear()
@@ -578,7 +633,8 @@ def analyze_local_resume(file_path: str, file_name: str):
                 file_name=file_name,
                 parsed_data=parsed_resume.model_dump(),
                 job_roles=[match.model_dump() for match in job_matches],
-                summary=summary.model_dump()
+                summary=summary.model_dump(),
+                raw_text=raw_text
             )
             
             st.success("✅ Phase 1 cached - future loads will be instant!")
@@ -612,7 +668,16 @@ def analyze_local_resume(file_path: str, file_name: str):
                 )
                 
                 jobs_container.info("🌐 Fetching job postings for your top 3 recommended roles...")
-                
+
+                # Pre-normalize once so per-job matching below (and downstream
+                # skill gap analysis) avoids repeated .lower() calls
+                skills_lower = frozenset(s.lower() for s in parsed_resume.skills)
+                role_tokens = [
+                    (role_match.role_title,
+                     {word.lower() for word in role_match.role_title.split() if len(word) > 3})
+                    for role_match in job_matches
+                ]
+
                 # Build Phase 2 state
                 phase2_state = {
                     'messages': [],
@@ -626,11 +691,17 @@ def analyze_local_resume(file_path: str, file_name: str):
                     'error': None,
                     'job_postings': [],
                     'skill_gap_analysis': None,
-                    'enable_skill_gap': True
+                    'enable_skill_gap': True,
+                    'skills_lower': skills_lower,
+                    'role_tokens': role_tokens
                 }
                 
-                # Fetch jobs
-                job_fetch_result = st.session_state.agent._fetch_job_postings(phase2_state)
+                # Fetch jobs (join the background fetch if it was started
+                # during summary streaming)
+                if jobs_future is not None:
+                    job_fetch_result = jobs_future.result()
+                else:
+                    job_fetch_result = agent._fetch_job_postings(phase2_state)
                 
                 if job_fetch_result.get('error'):
                     jobs_container.warning(f"⚠️ Could not fetch jobs: {job_fetch_result['error']}")
@@ -640,20 +711,17 @@ def analyze_local_resume(file_path: str, file_name: str):
                     if job_postings:
                         jobs_container.success(f"✅ Fetched {len(job_postings)} job postings")
                         
-                        # Show job summary by role
-                        jobs_by_role = {}
+                        # Show job summary by role (one .lower() per job,
+                        # token sets precomputed above)
+                        jobs_by_role = defaultdict(list)
                         for job in job_postings:
-                            matched_role = None
-                            for role_match in job_matches:
-                                if any(word.lower() in job.title.lower() 
-                                      for word in role_match.role_title.split() 
-                                      if len(word) > 3):
-                                    matched_role = role_match.role_title
-                                    break
-                            
+                            title_lc = job.title.lower()
+                            matched_role = next(
+                                (rt for rt, toks in role_tokens
+                                 if any(t in title_lc for t in toks)),
+                                None
+                            )
                             if matched_role:
-                                if matched_role not in jobs_by_role:
-                                    jobs_by_role[matched_role] = []
                                 jobs_by_role[matched_role].append(job)
                         
                         for role, role_jobs in jobs_by_role.items():
@@ -677,7 +745,7 @@ def analyze_local_resume(file_path: str, file_name: str):
                         gaps_container.info("🧠 Analyzing your skills vs market requirements...")
                         
                         phase2_state['job_postings'] = job_postings
-                        skill_gap_result = st.session_state.agent._analyze_skill_gaps(phase2_state)
+                        skill_gap_result = agent._analyze_skill_gaps(phase2_state)
                         
                         if skill_gap_result.get('error'):
                             gaps_container.error(f"❌ Skill gap analysis failed: {skill_gap_result['error']}")
@@ -726,14 +794,6 @@ def analyze_local_resume(file_path: str, file_name: str):
             'enable_skill_gap': st.session_state.enable_skill_gap
         }
         
-        # Cleanup
-        doc_store.close()
-        
-        temp_file = Path(file_path)
-        if temp_file.exists():
-            temp_file.unlink()
-        
-        time.sleep(1)
         st.success("🎉 Resume analyzed successfully!")
         st.balloons()
         
@@ -746,10 +806,14 @@ def analyze_local_resume(file_path: str, file_name: str):
         st.error(f"❌ Error analyzing resume: {str(e)}")
         progress_placeholder.empty()
         status_placeholder.empty()
-        
+
         with st.expander("🐛 Error Details"):
             st.exception(e)
 
+    finally:
+        # Temp upload is no longer needed once analysis (or failure) completes
+        Path(file_path).unlink(missing_ok=True)
+
 
 
 def analyze_resume(file_path: str, file_name: str):
@@ -760,17 +824,15 @@ def analyze_resume(file_path: str, file_name: str):
     status_text = st.empty()
     
     try:
-        # Initialize agent if not exists
-        if st.session_state.agent is None:
-            status_text.text("🤖 Initializing AI Agent...")
-            progress_bar.progress(20)
-            st.session_state.agent = JobSearchAgent()
-        
+        status_text.text("🤖 Initializing AI Agent...")
+        progress_bar.progress(20)
+        agent = get_agent()
+
         status_text.text("📄 Processing resume...")
         progress_bar.progress(40)
-        
+
         # Process resume
-        result = st.session_state.agent.process_resume(
+        result = agent.process_resume(
             file_id="local",
             file_name=file_name
         )
@@ -781,7 +843,6 @@ def analyze_resume(file_path: str, file_name: str):
         # Store result in session state
         st.session_state.processed_resume = result
         
-        time.sleep(1)
         st.success("🎉 Resume analyzed successfully!")
         st.balloons()
         
@@ -799,23 +860,78 @@ def analyze_resume_from_drive(file_id: str, file_name: str):
     
     progress = st.progress(0)
     status = st.empty()
-    
+
     try:
-        # Initialize agent
-        if st.session_state.agent is None:
-            from src.agent import JobSearchAgent
-            st.session_state.agent = JobSearchAgent()
-        
-        status.info("🚀 Starting resume analysis...")
-        progress.progress(10)
-        
-        # Run workflow
-        result = st.session_state.agent.process_resume(
-            file_id=file_id,
-            file_name=file_name,
-            enable_skill_gap=True
-        )
-        
+        # Single-flight: if another session/tab is already analyzing this
+        # file, wait for that run instead of duplicating 10+ min of LLM work
+        with _inflight_lock:
+            pipeline_future = _inflight.get(file_id)
+            is_owner = pipeline_future is None
+            if is_owner:
+                pipeline_future = Future()
+                _inflight[file_id] = pipeline_future
+
+        if not is_owner:
+            status.info("⏳ This resume is already being analyzed - waiting for that run...")
+            try:
+                result = pipeline_future.result(timeout=_INFLIGHT_WAIT_S)
+            except (CancelledError, FuturesTimeoutError):
+                # The owning run was interrupted (Streamlit rerun/stop) or
+                # is taking implausibly long - run the pipeline ourselves
+                # instead of failing the waiting session
+                status.info("🚀 Previous run didn't finish - starting analysis...")
+                result = get_agent().process_resume(
+                    file_id=file_id,
+                    file_name=file_name,
+                    enable_skill_gap=True
+                )
+        else:
+            try:
+                # Kick the download off in the background so it overlaps with
+                # agent initialization (network-bound vs. import/CPU-bound work)
+                dl_future = None
+                if st.session_state.drive_handler is not None:
+                    executor = ThreadPoolExecutor(max_workers=1)
+                    dl_future = executor.submit(
+                        st.session_state.drive_handler.download_file,
+                        file_id,
+                        str(staging_path(file_id, file_name))
+                    )
+
+                # Initialize agent (cached - only the first call per process is slow)
+                agent = get_agent()
+
+                # Wait for the pre-staged download before the agent needs the file
+                if dl_future is not None:
+                    try:
+                        dl_future.result()
+                    except Exception as e:
+                        st.warning(f"⚠️ Background download failed, will retry: {e}")
+
+                status.info("🚀 Starting resume analysis...")
+                progress.progress(10)
+
+                # Run workflow
+                result = agent.process_resume(
+                    file_id=file_id,
+                    file_name=file_name,
+                    enable_skill_gap=True
+                )
+                pipeline_future.set_result(result)
+            except BaseException as e:
+                # Streamlit's rerun/stop control-flow exceptions subclass
+                # BaseException, not Exception - either way waiters must
+                # never be left blocked on a future nothing will resolve
+                if isinstance(e, Exception):
+                    pipeline_future.set_exception(e)
+                else:
+                    pipeline_future.cancel()
+                raise
+            finally:
+                with _inflight_lock:
+                    _inflight.pop(file_id, None)
+
+
         progress.progress(100)
         status.empty()
         progress.empty()
@@ -901,7 +1017,6 @@ def analyze_resume_from_drive(file_id: str, file_name: str):
                 jobs = result['job_postings']
                 
                 # Group by role
-                from collections import defaultdict
                 jobs_by_source = defaultdict(list)
                 for job in jobs:
                     jobs_by_source[job.source].append(job)
@@ -1,110 +1,176 @@
 """Database management component for Cache and Job History."""
 
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import streamlit as st
-from src.document_store import DocumentStore
-from src.jobs.job_store import JobStore
+from src.UI.resources import get_doc_store, get_job_store
 from src.cleanup import cleanup_all, get_directory_size
-import pandas as pd
 from datetime import datetime
 
 
+# Stat queries are re-run on every Streamlit rerun (any widget interaction);
+# a short TTL amortizes the SQLite round trips without letting the numbers
+# go meaningfully stale. Mutating buttons clear these explicitly.
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_cache_stats() -> dict:
+    """Resume-cache statistics, memoized across reruns."""
+    return get_doc_store().get_cache_stats()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_job_stats() -> dict:
+    """Job-history statistics, memoized across reruns."""
+    return get_job_store().get_stats()
+
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _cached_recent_sessions() -> list:
+    """Recent-session rows, formatted in SQL and display-ready."""
+    return get_job_store().get_recent_sessions_rows(limit=10)
+
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _cached_session_options() -> tuple:
+    """Session selector labels and label->session map, precomputed with the
+    query so unrelated widget reruns don't re-format every label."""
+    sessions = get_job_store().get_all_sessions_with_counts()
+
+    labels = [
+        f"{s['created_at']} - {s['resume_filename']} ({s['jobs_count']} jobs)"
+        for s in sessions
+    ]
+    return labels, dict(zip(labels, sessions))
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_sidebar_stats() -> tuple:
+    """Cache and job stats fetched together on two threads.
+
+    SQLite releases the GIL during I/O, so the cold path costs
+    max(t_cache, t_jobs) instead of the sum. Stores are resolved on the
+    script thread; only the queries run on workers.
+    """
+    doc_store, job_store = get_doc_store(), get_job_store()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        cache_future = executor.submit(doc_store.get_cache_stats)
+        jobs_future = executor.submit(job_store.get_stats)
+        return cache_future.result(), jobs_future.result()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _dir_size(path: str) -> float:
+    """Directory size in MB, memoized - each call is a full stat traversal."""
+    return get_directory_size(path)
+
+
 def render_database_manager():
     """Render database management interface for both Cache and Job History."""
     
     st.title("🗄️ Database Manager")
-    
-    # Create tabs
-    tab1, tab2, tab3 = st.tabs([
-        "📦 Resume Cache",
-        "💼 Job History",
-        "🧹 Cleanup"
-    ])
-    
-    # ========== TAB 1: RESUME CACHE ==========
-    with tab1:
-        render_cache_stats()
-    
-    # ========== TAB 2: JOB HISTORY ==========
-    with tab2:
-        render_job_history_stats()
-    
-    # ========== TAB 3: CLEANUP ==========
-    with tab3:
-        render_cleanup_tools()
 
+    # st.tabs executes every tab body on each rerun, so all three panels
+    # would hit their databases per interaction. A radio renders (and
+    # queries for) only the visible panel.
+    panels = {
+        "📦 Resume Cache": render_cache_stats,
+        "💼 Job History": render_job_history_stats,
+        "🧹 Cleanup": render_cleanup_tools,
+    }
+
+    active = st.radio(
+        "Section",
+        options=list(panels),
+        horizontal=True,
+        label_visibility="collapsed",
+        key="db_manager_panel"
+    )
+
+    panels[active]()
 
+
+@st.fragment
 def render_cache_stats():
-    """Render cache statistics."""
+    """Render cache statistics.
+
+    Runs as a fragment so widget interactions inside the panel rerun only
+    this function, not the whole page.
+    """
     
     st.subheader("📦 Resume Cache Database")
     st.caption("Fast access to previously analyzed resumes (Phase 1 only)")
     
     try:
-        with DocumentStore() as doc_store:
-            stats = doc_store.get_cache_stats()
-            
-            # Metrics
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.metric(
-                    "Cached Resumes",
-                    stats.get('total_cached_resumes', 0),
-                    help="Phase 1 analyses stored for instant reload"
-                )
+        stats = _cached_cache_stats()
+
+        # Metrics
+        col1, col2, col3 = st.columns(3)
             
-            with col2:
-                st.metric(
-                    "Database Size",
-                    f"{stats.get('database_size_mb', 0):.2f} MB",
-                    help="Size of resume cache database"
-                )
+        with col1:
+            st.metric(
+                "Cached Resumes",
+                stats.get('total_cached_resumes', 0),
+                help="Phase 1 analyses stored for instant reload"
+            )
             
-            with col3:
-                st.metric(
-                    "Total Analyses",
-                    stats.get('total_cached_resumes', 0)
-                )
+        with col2:
+            st.metric(
+                "Database Size",
+                f"{stats.get('database_size_mb', 0):.2f} MB",
+                help="Size of resume cache database"
+            )
             
-            # Recent accesses
-            if stats.get('recent_accesses'):
-                st.markdown("---")
-                st.subheader("🕐 Recently Accessed")
-                
-                recent_data = []
-                for access in stats['recent_accesses']:
-                    recent_data.append({
-                        'File Name': access['file_name'],
-                        'Last Accessed': access['last_accessed'],
-                        'Hit Count': access.get('access_count', 1)
-                    })
-                
-                df = pd.DataFrame(recent_data)
-                st.dataframe(df, use_container_width=True, hide_index=True)
+        with col3:
+            st.metric(
+                "Total Analyses",
+                stats.get('total_cached_resumes', 0)
+            )
             
-            # Actions
+        # Recent accesses
+        if stats.get('recent_accesses'):
             st.markdown("---")
-            col1, col2 = st.columns(2)
+            st.subheader("🕐 Recently Accessed")
+                
+            recent_data = [
+                {
+                    'File Name': access['file_name'],
+                    'Last Accessed': access['last_accessed'],
+                    'Hit Count': access.get('access_count', 1)
+                }
+                for access in stats['recent_accesses']
+            ]
+
+            st.dataframe(recent_data, use_container_width=True, hide_index=True)
             
-            with col1:
-                if st.button("🔄 Refresh Stats", use_container_width=True):
-                    st.rerun()
+        # Actions
+        st.markdown("---")
+        col1, col2 = st.columns(2)
             
-            with col2:
-                if st.button("🗑️ Clear All Cache", type="primary", use_container_width=True):
-                    if st.session_state.get('confirm_clear_cache', False):
-                        doc_store.clear_cache()
-                        st.success("✅ Cache cleared!")
-                        st.session_state.confirm_clear_cache = False
-                        st.rerun()
-                    else:
-                        st.session_state.confirm_clear_cache = True
-                        st.warning("⚠️ Click again to confirm")
+        with col1:
+            if st.button("🔄 Refresh Stats", use_container_width=True):
+                _cached_cache_stats.clear()
+                st.rerun(scope="fragment")
+
+        with col2:
+            if st.button("🗑️ Clear All Cache", type="primary", use_container_width=True):
+                if st.session_state.get('confirm_clear_cache', False):
+                    get_doc_store().clear_cache()
+                    _cached_cache_stats.clear()
+                    st.success("✅ Cache cleared!")
+                    st.session_state.confirm_clear_cache = False
+                    # Cache contents feed widgets outside this fragment too
+                    st.rerun(scope="app")
+                else:
+                    st.session_state.confirm_clear_cache = True
+                    st.warning("⚠️ Click again to confirm")
     
     except Exception as e:
         st.error(f"❌ Error: {str(e)}")
 
 
+@st.fragment
 def render_job_history_stats():
     """Render job history statistics."""
     
@@ -112,9 +178,9 @@ def render_job_history_stats():
     st.caption("Complete job search history with skill gap analysis")
     
     try:
-        job_store = JobStore()
-        stats = job_store.get_stats()
-        
+        job_store = get_job_store()
+        stats = _cached_job_stats()
+
         # Metrics
         col1, col2, col3, col4 = st.columns(4)
         
@@ -140,93 +206,92 @@ def render_job_history_stats():
             )
         
         with col4:
-            db_size = get_directory_size('db')
+            db_size = _dir_size('db')
             st.metric(
                 "Database Size",
                 f"{db_size:.2f} MB"
             )
         
-        # Recent sessions
-        if stats.get('recent_sessions'):
+        # Recent sessions (rows come back display-ready from SQL)
+        session_data = _cached_recent_sessions()
+        if session_data:
             st.markdown("---")
             st.subheader("📅 Recent Job Searches")
-            
-            session_data = []
-            for session in stats['recent_sessions']:
-                session_data.append({
-                    'Date': session.get('search_date', 'N/A'),
-                    'Resume': session.get('resume_filename', 'N/A'),
-                    'Jobs Found': session.get('total_jobs_found', 0),
-                    'Market Readiness': f"{session.get('market_readiness', 0)}%" if session.get('market_readiness') else 'N/A'
-                })
-            
-            df = pd.DataFrame(session_data)
-            st.dataframe(df, use_container_width=True, hide_index=True)
+            st.dataframe(session_data, use_container_width=True, hide_index=True)
         
         # Detailed session browser
         st.markdown("---")
         st.subheader("🔍 Browse Sessions")
         
-        # Get all sessions
-        all_sessions = job_store.get_all_sessions()
-        
-        if all_sessions:
-            # Session selector
-            session_options = {
-                f"{s['created_at']} - {s['resume_filename']} ({s['jobs_count']} jobs)": s['session_id']
-                for s in all_sessions
-            }
-            
+        # Labels and lookup map are precomputed alongside the cached query
+        session_labels, session_options = _cached_session_options()
+
+        if session_labels:
             selected_display = st.selectbox(
                 "Select a session to view details:",
-                options=list(session_options.keys())
+                options=session_labels
             )
-            
+
             if selected_display:
-                session_id = session_options[selected_display]
-                
-                # Get session details
-                jobs = job_store.get_session_jobs(session_id)
-                
+                session = session_options[selected_display]
+                session_id = session['session_id']
+
+                # One scalar confirm key; selecting another session voids a
+                # stale confirmation instead of leaving per-session keys behind
+                if st.session_state.get('pending_delete') not in (None, session_id):
+                    st.session_state.pending_delete = None
+
+                # Paged server-side: only the 50 rows shown are hydrated
+                n_pages = max(1, -(-session['jobs_count'] // 50))
+                page = st.number_input(
+                    "Page", min_value=1, max_value=n_pages, value=1,
+                    disabled=(n_pages == 1)
+                )
+                jobs = job_store.get_session_jobs(
+                    session_id, limit=50, offset=(page - 1) * 50
+                )
+
                 if jobs:
                     st.markdown(f"**Session ID:** `{session_id}`")
-                    st.markdown(f"**Jobs in this session:** {len(jobs)}")
+                    st.markdown(f"**Jobs in this session:** {session['jobs_count']}")
                     
                     # Display jobs in expander
                     with st.expander(f"📋 View {len(jobs)} Jobs", expanded=False):
-                        job_data = []
-                        for job in jobs[:50]:  # Limit to 50 for performance
-                            job_data.append({
+                        job_data = [
+                            {
                                 'Title': job.get('title', 'N/A'),
                                 'Company': job.get('company', 'N/A'),
                                 'Location': job.get('location', 'N/A'),
                                 'Salary': job.get('salary', 'Not specified'),
                                 'Source': job.get('source', 'N/A'),
                                 'URL': job.get('url', 'N/A')
-                            })
-                        
-                        jobs_df = pd.DataFrame(job_data)
-                        st.dataframe(jobs_df, use_container_width=True, hide_index=True)
+                            }
+                            for job in jobs  # Already limited to 50 server-side
+                        ]
+
+                        st.dataframe(job_data, use_container_width=True, hide_index=True)
                     
                     # Delete session option
                     if st.button(f"🗑️ Delete This Session", use_container_width=True):
-                        if st.session_state.get(f'confirm_delete_{session_id}', False):
+                        if st.session_state.get('pending_delete') == session_id:
                             job_store.delete_session(session_id)
+                            _cached_job_stats.clear()
+                            _cached_recent_sessions.clear()
+                            _cached_session_options.clear()
                             st.success("✅ Session deleted!")
-                            st.session_state[f'confirm_delete_{session_id}'] = False
-                            st.rerun()
+                            st.session_state.pending_delete = None
+                            st.rerun(scope="app")
                         else:
-                            st.session_state[f'confirm_delete_{session_id}'] = True
+                            st.session_state.pending_delete = session_id
                             st.warning("⚠️ Click again to confirm deletion")
         else:
             st.info("No job search sessions found yet")
-        
-        job_store.close()
-    
+
     except Exception as e:
         st.error(f"❌ Error: {str(e)}")
 
 
+@st.fragment
 def render_cleanup_tools():
     """Render cleanup tools."""
     
@@ -239,11 +304,11 @@ def render_cleanup_tools():
     col1, col2 = st.columns(2)
     
     with col1:
-        logs_size = get_directory_size('logs')
+        logs_size = _dir_size('logs')
         st.metric("Logs Directory", f"{logs_size:.2f} MB")
-    
+
     with col2:
-        exports_size = get_directory_size('exports')
+        exports_size = _dir_size('exports')
         st.metric("Exports Directory", f"{exports_size:.2f} MB")
     
     st.markdown("---")
@@ -280,7 +345,8 @@ def render_cleanup_tools():
                 logs_max_age=logs_age,
                 exports_keep=exports_keep
             )
-            
+            _dir_size.clear()
+
             st.success("✅ Cleanup complete!")
             
             col1, col2 = st.columns(2)
@@ -294,16 +360,17 @@ def render_cleanup_tools():
                 st.metric("New Exports Size", f"{results['exports_size_mb']:.2f} MB")
 
 
+@st.fragment
 def render_sidebar_database_info():
     """Render database info in sidebar."""
+    # Nothing to report before either database exists; skipping also
+    # avoids creating the DBs just to show zeros on first run
+    if not Path('db/resume_cache.db').exists() and not Path('db/job_history.db').exists():
+        return
+
     try:
-        with DocumentStore() as doc_store:
-            cache_stats = doc_store.get_cache_stats()
-        
-        job_store = JobStore()
-        job_stats = job_store.get_stats()
-        job_store.close()
-        
+        cache_stats, job_stats = _cached_sidebar_stats()
+
         st.sidebar.markdown("### 🗄️ Database")
         
         col1, col2 = st.columns(2)
@@ -321,6 +388,6 @@ def render_sidebar_database_info():
                 job_stats.get('total_jobs', 0),
                 help="Total jobs analyzed"
             )
-    
-    except:
+
+    except (sqlite3.DatabaseError, OSError):
         pass
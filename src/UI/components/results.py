@@ -1,11 +1,135 @@
 """Results display component for resume analysis."""
 
+from __future__ import annotations
+
 import streamlit as st
-import plotly.graph_objects as go
-import plotly.express as px
-from typing import Dict, Any
+from typing import Dict, Any, TYPE_CHECKING
 from src.UI.components.skill_gap_viewer import render_skill_gap_analysis
 
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+_SKILL_TAG = (
+    '<span style="display: inline-block; background-color: #3B82F6; color: white; '
+    'padding: 0.4rem 0.8rem; margin: 0.3rem; border-radius: 20px; font-size: 0.9rem;">{}</span>'
+)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _skills_tags_html(skills: tuple) -> str:
+    """Assembled skill-tag HTML, cached per unique skill list so reruns
+    reuse the string instead of rebuilding it tag by tag."""
+    tags = "".join(_SKILL_TAG.format(skill) for skill in skills)
+    return f'<div style="margin-top: 1rem;">{tags}</div>'
+
+
+# Static gauge/layout specs, built once at import instead of per call.
+_SKILLS_GAUGE_BASE = {
+    'axis': {'range': [None, 50]},
+    'bar': {'color': "#3B82F6"},
+    'steps': [
+        {'range': [0, 15], 'color': "#FEE2E2"},
+        {'range': [15, 30], 'color': "#FEF3C7"},
+        {'range': [30, 50], 'color': "#D1FAE5"}
+    ],
+    'threshold': {
+        'line': {'color': "red", 'width': 4},
+        'thickness': 0.75,
+        'value': 35
+    }
+}
+
+_QUALITY_GAUGE_BASE = {
+    'axis': {'range': [None, 10], 'tickwidth': 1, 'tickcolor': "darkblue"},
+    'bgcolor': "white",
+    'borderwidth': 2,
+    'bordercolor': "gray",
+    'steps': [
+        {'range': [0, 4], 'color': '#FEE2E2'},
+        {'range': [4, 7], 'color': '#FEF3C7'},
+        {'range': [7, 10], 'color': '#D1FAE5'}
+    ],
+    'threshold': {
+        'line': {'color': "red", 'width': 4},
+        'thickness': 0.75,
+        'value': 8
+    }
+}
+
+_SMALL_LAYOUT = dict(height=250, margin=dict(l=20, r=20, t=40, b=20))
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _build_skills_gauge(n_skills: int) -> go.Figure:
+    """Skills-count gauge, cached per count - Plotly figure construction
+    and JSON serialization dominate rerender cost otherwise."""
+    # Imported lazily: Plotly costs ~200ms cold and most reruns hit the
+    # st.cache_data layer above without ever building a figure
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=n_skills,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "Skills Count"},
+        gauge=_SKILLS_GAUGE_BASE
+    ))
+    fig.update_layout(**_SMALL_LAYOUT)
+    return fig
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _build_confidence_chart(matches: tuple) -> go.Figure:
+    """Role-confidence bar chart, keyed on (title, score) pairs."""
+    import plotly.graph_objects as go
+
+    fig = go.Figure(data=[
+        go.Bar(
+            x=[title for title, _ in matches],
+            # Rounded: full-precision floats serialize to ~17-digit JSON
+            # in the payload shipped to the browser
+            y=[round(score * 100, 1) for _, score in matches],
+            marker_color=['#10B981', '#3B82F6', '#6366F1'],
+            text=[f"{score:.0%}" for _, score in matches],
+            textposition='auto',
+        )
+    ])
+
+    fig.update_layout(
+        title="Job Role Match Confidence",
+        xaxis_title="Job Role",
+        yaxis_title="Confidence Score (%)",
+        yaxis_range=[0, 100],
+        height=400,
+        showlegend=False
+    )
+    return fig
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _build_quality_gauge(quality_score: float) -> go.Figure:
+    """Quality-score gauge, cached per score."""
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number+delta",
+        value=quality_score,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "Quality Score", 'font': {'size': 24}},
+        delta={'reference': 7.0, 'increasing': {'color': "green"}},
+        gauge={
+            **_QUALITY_GAUGE_BASE,
+            'bar': {'color': "#10B981" if quality_score >= 7 else "#F59E0B"},
+        }
+    ))
+
+    fig.update_layout(
+        height=300,
+        margin=dict(l=20, r=20, t=60, b=20),
+        font={'color': "darkblue", 'family': "Arial"}
+    )
+    return fig
+
 
 def render_results(result: Dict[str, Any]):
     """Render complete analysis results with visualizations.
@@ -110,35 +234,11 @@ def render_skills_section(parsed_resume):
         st.subheader(f"Total Skills: {len(parsed_resume.skills)}")
         
         # Display skills as tags
-        skills_html = ""
-        for skill in parsed_resume.skills:
-            skills_html += f'<span style="display: inline-block; background-color: #3B82F6; color: white; padding: 0.4rem 0.8rem; margin: 0.3rem; border-radius: 20px; font-size: 0.9rem;">{skill}</span>'
-        
-        st.markdown(f'<div style="margin-top: 1rem;">{skills_html}</div>', unsafe_allow_html=True)
+        st.markdown(_skills_tags_html(tuple(parsed_resume.skills)), unsafe_allow_html=True)
     
     with col2:
         # Skills count visualization
-        fig = go.Figure(go.Indicator(
-            mode="gauge+number",
-            value=len(parsed_resume.skills),
-            domain={'x': [0, 1], 'y': [0, 1]},
-            title={'text': "Skills Count"},
-            gauge={
-                'axis': {'range': [None, 50]},
-                'bar': {'color': "#3B82F6"},
-                'steps': [
-                    {'range': [0, 15], 'color': "#FEE2E2"},
-                    {'range': [15, 30], 'color': "#FEF3C7"},
-                    {'range': [30, 50], 'color': "#D1FAE5"}
-                ],
-                'threshold': {
-                    'line': {'color': "red", 'width': 4},
-                    'thickness': 0.75,
-                    'value': 35
-                }
-            }
-        ))
-        fig.update_layout(height=250, margin=dict(l=20, r=20, t=40, b=20))
+        fig = _build_skills_gauge(len(parsed_resume.skills))
         st.plotly_chart(fig, config={'displayModeBar': False}, key='skills_gauge')
 
 
@@ -160,36 +260,18 @@ def render_job_matches(job_matches):
             st.subheader("📝 Why This Role?")
             st.write(match.reasoning)
             
-            # Matching skills
+            # Matching skills (one markdown block, not a widget per cell)
             st.subheader("✅ Matching Skills")
-            skills_cols = st.columns(3)
-            for i, skill in enumerate(match.key_matching_skills):
-                with skills_cols[i % 3]:
-                    st.markdown(f"- {skill}")
+            st.markdown("\n".join(f"- {skill}" for skill in match.key_matching_skills))
     
     # Visualization: Confidence comparison
     st.subheader("📊 Confidence Score Comparison")
     
-    fig = go.Figure(data=[
-        go.Bar(
-            x=[match.role_title for match in job_matches],
-            y=[match.confidence_score * 100 for match in job_matches],
-            marker_color=['#10B981', '#3B82F6', '#6366F1'],
-            text=[f"{match.confidence_score:.0%}" for match in job_matches],
-            textposition='auto',
-        )
-    ])
-    
-    fig.update_layout(
-        title="Job Role Match Confidence",
-        xaxis_title="Job Role",
-        yaxis_title="Confidence Score (%)",
-        yaxis_range=[0, 100],
-        height=400,
-        showlegend=False
+    fig = _build_confidence_chart(
+        tuple((match.role_title, round(match.confidence_score, 4)) for match in job_matches)
     )
-    
-    st.plotly_chart(fig, config={'displayModeBar': False}, key='job_confidence_chart')
+    # staticPlot: three labelled bars don't need hover/zoom machinery
+    st.plotly_chart(fig, config={'staticPlot': True}, key='job_confidence_chart')
 
 
 def render_summary_section(summary):
@@ -205,37 +287,7 @@ def render_summary_section(summary):
     
     with col1:
         # Quality score gauge
-        fig = go.Figure(go.Indicator(
-            mode="gauge+number+delta",
-            value=summary.quality_score,
-            domain={'x': [0, 1], 'y': [0, 1]},
-            title={'text': "Quality Score", 'font': {'size': 24}},
-            delta={'reference': 7.0, 'increasing': {'color': "green"}},
-            gauge={
-                'axis': {'range': [None, 10], 'tickwidth': 1, 'tickcolor': "darkblue"},
-                'bar': {'color': "#10B981" if summary.quality_score >= 7 else "#F59E0B"},
-                'bgcolor': "white",
-                'borderwidth': 2,
-                'bordercolor': "gray",
-                'steps': [
-                    {'range': [0, 4], 'color': '#FEE2E2'},
-                    {'range': [4, 7], 'color': '#FEF3C7'},
-                    {'range': [7, 10], 'color': '#D1FAE5'}
-                ],
-                'threshold': {
-                    'line': {'color': "red", 'width': 4},
-                    'thickness': 0.75,
-                    'value': 8
-                }
-            }
-        ))
-        
-        fig.update_layout(
-            height=300,
-            margin=dict(l=20, r=20, t=60, b=20),
-            font={'color': "darkblue", 'family': "Arial"}
-        )
-        
+        fig = _build_quality_gauge(summary.quality_score)
         st.plotly_chart(fig, config={'displayModeBar': False}, key='quality_gauge')
     
     with col2:
@@ -245,26 +297,24 @@ def render_summary_section(summary):
         if summary.years_of_experience:
             st.metric("📅 Experience", f"{summary.years_of_experience} years")
     
-    # Strengths
+    # Strengths (single element instead of one st.success per strength)
     if summary.key_strengths:
         st.subheader("💪 Key Strengths")
-        strengths_cols = st.columns(2)
-        for i, strength in enumerate(summary.key_strengths):
-            with strengths_cols[i % 2]:
-                st.success(f"✅ {strength}")
-    
+        st.success("\n".join(f"✅ {strength}  " for strength in summary.key_strengths))
+
     # Issues
     if summary.grammatical_issues:
         st.subheader("⚠️ Issues Found")
         with st.expander(f"View {len(summary.grammatical_issues)} issues"):
-            for issue in summary.grammatical_issues:
-                st.warning(f"⚠️ {issue}")
-    
+            st.warning("\n".join(f"⚠️ {issue}  " for issue in summary.grammatical_issues))
+
     # Improvement suggestions
     if summary.improvement_suggestions:
         st.subheader("💡 Improvement Suggestions")
-        for i, suggestion in enumerate(summary.improvement_suggestions, 1):
-            st.markdown(f"{i}. {suggestion}")
+        st.markdown("\n".join(
+            f"{i}. {suggestion}"
+            for i, suggestion in enumerate(summary.improvement_suggestions, 1)
+        ))
 
 
 def render_experience_section(parsed_resume):
@@ -276,15 +326,20 @@ def render_experience_section(parsed_resume):
     
     for idx, exp in enumerate(parsed_resume.experience, 1):
         with st.expander(f"**{exp.position}** at **{exp.company}** ({exp.duration})", expanded=(idx==1)):
-            
-            st.markdown(f"**Duration:** {exp.duration}")
-            st.markdown(f"**Company:** {exp.company}")
-            st.markdown(f"**Position:** {exp.position}")
-            
+
+            # One markdown element per row - each st.markdown is a separate
+            # element in the Streamlit delta tree, so batching cuts render cost
+            body = (
+                f"**Duration:** {exp.duration}  \n"
+                f"**Company:** {exp.company}  \n"
+                f"**Position:** {exp.position}"
+            )
+
             if exp.description:
-                st.markdown("**Key Responsibilities:**")
-                for desc in exp.description:
-                    st.markdown(f"- {desc}")
+                responsibilities = "\n".join(f"- {desc}" for desc in exp.description)
+                body += f"\n\n**Key Responsibilities:**\n{responsibilities}"
+
+            st.markdown(body)
 
 
 def render_education_section(parsed_resume):
@@ -293,20 +348,15 @@ def render_education_section(parsed_resume):
         return
     
     st.header("🎓 Education")
-    
-    for edu in parsed_resume.education:
-        col1, col2, col3 = st.columns([2, 2, 1])
-        
-        with col1:
-            st.markdown(f"**{edu.institution}**")
-        
-        with col2:
-            degree_text = edu.degree
-            if edu.field:
-                degree_text += f", {edu.field}"
-            st.markdown(degree_text)
-        
-        with col3:
-            if edu.graduation_year:
-                st.markdown(f"**{edu.graduation_year}**")
+
+    # Single dataframe instead of three widgets per education entry
+    edu_rows = [
+        {
+            'Institution': edu.institution,
+            'Degree': edu.degree + (f", {edu.field}" if edu.field else ""),
+            'Year': edu.graduation_year or ""
+        }
+        for edu in parsed_resume.education
+    ]
+    st.dataframe(edu_rows, use_container_width=True, hide_index=True)
         
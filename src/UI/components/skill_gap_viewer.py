@@ -1,14 +1,75 @@
 # src/UI/components/skill_gap_viewer.py
 """Skill Gap Analysis visualization component."""
 
+import json
+
 import streamlit as st
 from typing import Optional
 from src.state import SkillGapAnalysis
 
+# Shared across reruns so the per-role loops don't rebuild them
+_PRIORITY_ICON = {"high": "🔴", "medium": "🟡", "low": "🟢"}
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _build_markdown_blocks(skill_gap_json: str) -> dict:
+    """Pre-rendered content (markdown blobs and table rows) per section.
+
+    Keyed on the analysis JSON dump (a hashable, stable key), so reruns
+    showing the same analysis skip all of the building below.
+    """
+    data = json.loads(skill_gap_json)
+    blocks = {}
+
+    for i, role in enumerate(data.get('role_analyses', [])):
+        blocks[f'matched_{i}'] = " · ".join(
+            f"✓ **{skill}**" for skill in role.get('matched_skills', [])
+        )
+        # Table rows instead of markdown: the whole list ships to the
+        # browser as one dataframe message
+        blocks[f'missing_{i}'] = [
+            {
+                '': _PRIORITY_ICON.get(gap['priority'], "⚪"),
+                'Skill': gap['skill_name'],
+                'Category': gap['category'],
+                'Jobs': gap['found_in_jobs_count'],
+                'Priority': gap['priority'].upper(),
+                'Learning Time': gap['estimated_learning_time']
+            }
+            for gap in role.get('missing_skills', [])[:10]  # Top 10
+        ]
+        blocks[f'learn_{i}'] = "\n".join(
+            f"{n}. **{skill}**"
+            for n, skill in enumerate(role.get('top_skills_to_learn', []), 1)
+        )
+
+    for key in ('common_gaps', 'quick_wins', 'long_term_goals', 'niche_skills'):
+        blocks[key] = [
+            {'#': idx, 'Skill': skill}
+            for idx, skill in enumerate(data.get(key, [])[:8], 1)
+        ]
+    blocks['trending'] = "  \n".join(
+        f"🔥 **{skill}**" for skill in data.get('trending_skills', [])
+    )
+    blocks['declining'] = "  \n".join(
+        f"📉 {skill}" for skill in data.get('declining_skills', [])
+    )
+
+    for key in ('immediate_actions', 'one_month_plan', 'three_month_plan', 'six_month_plan'):
+        blocks[key] = "\n".join(
+            f"{idx}. {action}" for idx, action in enumerate(data.get(key, []), 1)
+        )
+
+    return blocks
+
+
+@st.fragment
 def render_skill_gap_analysis(skill_gap: Optional[SkillGapAnalysis]):
     """
     Render comprehensive skill gap analysis visualization.
-    
+
+    Runs as a fragment: this is the largest widget tree in the app, and
+    isolating it keeps unrelated interactions from re-serializing it.
+
     Args:
         skill_gap: SkillGapAnalysis object from agent
     """
@@ -18,37 +79,40 @@ def render_skill_gap_analysis(skill_gap: Optional[SkillGapAnalysis]):
     
     st.markdown("---")
     st.header("🔍 Skill Gap Analysis")
-    
+
+    blocks = _build_markdown_blocks(skill_gap.model_dump_json())
+
     # ===== Overall Metrics =====
     col1, col2, col3, col4 = st.columns(4)
-    
+
     with col1:
+        readiness_delta = skill_gap.overall_market_readiness - 50
         st.metric(
             "Market Readiness",
             f"{skill_gap.overall_market_readiness}%",
-            delta=f"{skill_gap.overall_market_readiness - 50:+.1f}% vs avg"
+            delta=f"{readiness_delta:+.1f}% vs avg"
         )
-    
+
     with col2:
         st.metric(
             "Jobs Analyzed",
             skill_gap.total_jobs_analyzed
         )
-    
+
+    # Plain metrics with tooltips: the old deltas just restated the value,
+    # costing an extra delta field + arrow per metric per rerun
     with col3:
         st.metric(
             "Common Gaps",
             len(skill_gap.common_gaps),
-            delta=f"-{len(skill_gap.common_gaps)} skills needed",
-            delta_color="inverse"
+            help="Skills needed across all target roles"
         )
-    
+
     with col4:
         st.metric(
             "Quick Wins",
             len(skill_gap.quick_wins),
-            delta=f"+{len(skill_gap.quick_wins)} easy skills",
-            delta_color="normal"
+            help="Easy-to-learn, high-impact skills"
         )
     
     st.markdown("---")
@@ -57,71 +121,22 @@ def render_skill_gap_analysis(skill_gap: Optional[SkillGapAnalysis]):
     st.subheader("🎯 Role-Specific Analysis")
     
     for idx, role_analysis in enumerate(skill_gap.role_analyses, 1):
-        with st.expander(f"**{idx}. {role_analysis.job_role}**", expanded=(idx == 1)):
-            
-            # Metrics row
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.metric("Match %", f"{role_analysis.match_percentage:.1f}%")
-            
-            with col2:
-                st.metric("Coverage Score", f"{role_analysis.skill_coverage_score}/10")
-            
-            with col3:
-                st.metric("Jobs Analyzed", role_analysis.jobs_analyzed)
-            
-            st.markdown(f"**Estimated Readiness:** {role_analysis.estimated_readiness}")
-            
-            # Progress bar for match percentage
-            st.progress(role_analysis.match_percentage / 100)
-            
-            # Matched Skills
-            if role_analysis.matched_skills:
-                st.markdown("### ✅ Skills You Have")
-                matched_cols = st.columns(min(len(role_analysis.matched_skills), 4))
-                for i, skill in enumerate(role_analysis.matched_skills):
-                    with matched_cols[i % 4]:
-                        st.success(f"✓ {skill}")
-            
-            # Missing Skills
-            if role_analysis.missing_skills:
-                st.markdown("### 🚨 Skills to Develop")
-                
-                for gap in role_analysis.missing_skills[:10]:  # Top 10
-                    priority_color = {
-                        "high": "🔴",
-                        "medium": "🟡",
-                        "low": "🟢"
-                    }.get(gap.priority, "⚪")
-                    
-                    st.markdown(f"""
-                    {priority_color} **{gap.skill_name}** ({gap.category})
-                    - Found in **{gap.found_in_jobs_count}** jobs
-                    - Priority: **{gap.priority.upper()}**
-                    - Learning Time: **{gap.estimated_learning_time}**
-                    """)
-            
-            # Top Skills to Learn
-            if role_analysis.top_skills_to_learn:
-                st.markdown("### 🎓 Recommended Learning Priority")
-                for i, skill in enumerate(role_analysis.top_skills_to_learn, 1):
-                    st.markdown(f"{i}. **{skill}**")
-    
+        _render_role(role_analysis, idx, blocks)
+
     st.markdown("---")
     
     # ===== Cross-Role Insights =====
     st.subheader("🔗 Cross-Role Insights")
-    
-    col1, col2 = st.columns(2)
-    
+
+    # One 4-column layout message instead of two stacked st.columns(2)
+    col1, col2, col3, col4 = st.columns(4)
+
     with col1:
         st.markdown("### 🚨 Common Gaps (High Priority)")
         st.markdown("*Skills missing across ALL your target roles*")
         
         if skill_gap.common_gaps:
-            for idx, skill in enumerate(skill_gap.common_gaps[:8], 1):
-                st.error(f"{idx}. {skill}")
+            st.dataframe(blocks['common_gaps'], use_container_width=True, hide_index=True)
         else:
             st.success("✅ No common gaps - you're well-rounded!")
     
@@ -130,22 +145,16 @@ def render_skill_gap_analysis(skill_gap: Optional[SkillGapAnalysis]):
         st.markdown("*Easy-to-learn, high-impact skills*")
         
         if skill_gap.quick_wins:
-            for idx, skill in enumerate(skill_gap.quick_wins[:8], 1):
-                st.info(f"{idx}. {skill}")
+            st.dataframe(blocks['quick_wins'], use_container_width=True, hide_index=True)
         else:
             st.info("No quick wins identified")
-    
-    st.markdown("---")
-    
-    col3, col4 = st.columns(2)
-    
+
     with col3:
         st.markdown("### 🎓 Long-Term Goals")
         st.markdown("*Complex skills requiring 3-6 months*")
         
         if skill_gap.long_term_goals:
-            for idx, skill in enumerate(skill_gap.long_term_goals[:8], 1):
-                st.warning(f"{idx}. {skill}")
+            st.dataframe(blocks['long_term_goals'], use_container_width=True, hide_index=True)
         else:
             st.info("No long-term goals needed")
     
@@ -154,8 +163,7 @@ def render_skill_gap_analysis(skill_gap: Optional[SkillGapAnalysis]):
         st.markdown("*Specialized skills for specific roles*")
         
         if skill_gap.niche_skills:
-            for idx, skill in enumerate(skill_gap.niche_skills[:8], 1):
-                st.markdown(f"{idx}. {skill}")
+            st.dataframe(blocks['niche_skills'], use_container_width=True, hide_index=True)
         else:
             st.info("No niche skills identified")
     
@@ -169,62 +177,99 @@ def render_skill_gap_analysis(skill_gap: Optional[SkillGapAnalysis]):
     with col_trend1:
         st.markdown("### 📈 Trending Skills")
         if skill_gap.trending_skills:
-            for skill in skill_gap.trending_skills:
-                st.markdown(f"🔥 **{skill}**")
+            st.markdown(blocks['trending'])
         else:
             st.info("No trending skills data")
     
     with col_trend2:
         st.markdown("### 📉 Declining Skills")
         if skill_gap.declining_skills:
-            for skill in skill_gap.declining_skills:
-                st.markdown(f"📉 {skill}")
+            st.markdown(blocks['declining'])
         else:
             st.success("✅ No declining skills in your profile")
     
     st.markdown("---")
     
     # ===== Action Plans =====
-    st.subheader("📋 Your Learning Roadmap")
-    
-    tab1, tab2, tab3, tab4 = st.tabs([
-        "⚡ Immediate (2 weeks)",
-        "📅 1 Month",
-        "🎯 3 Months",
-        "🚀 6 Months"
-    ])
-    
-    with tab1:
-        st.markdown("### Actions for Next 2 Weeks")
-        if skill_gap.immediate_actions:
-            for idx, action in enumerate(skill_gap.immediate_actions, 1):
-                st.markdown(f"{idx}. {action}")
-        else:
-            st.info("No immediate actions")
-    
-    with tab2:
-        st.markdown("### 1-Month Plan")
-        if skill_gap.one_month_plan:
-            for idx, action in enumerate(skill_gap.one_month_plan, 1):
-                st.markdown(f"{idx}. {action}")
-        else:
-            st.info("No 1-month plan")
-    
-    with tab3:
-        st.markdown("### 3-Month Plan")
-        if skill_gap.three_month_plan:
-            for idx, action in enumerate(skill_gap.three_month_plan, 1):
-                st.markdown(f"{idx}. {action}")
-        else:
-            st.info("No 3-month plan")
-    
-    with tab4:
-        st.markdown("### 6-Month Plan")
-        if skill_gap.six_month_plan:
-            for idx, action in enumerate(skill_gap.six_month_plan, 1):
-                st.markdown(f"{idx}. {action}")
-        else:
-            st.info("No 6-month plan")
-    
+    _render_roadmap(skill_gap)
+
     st.markdown("---")
     st.caption(f"📅 Analysis performed on: {skill_gap.analysis_date}")
+
+
+@st.fragment
+def _render_role(role_analysis, idx: int, blocks: dict):
+    """One role expander, in its own fragment so opening or closing it
+    reruns just this role's block, not every expander on the page."""
+    with st.expander(f"**{idx}. {role_analysis.job_role}**", expanded=(idx == 1)):
+
+        # Metrics row
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.metric("Match %", f"{role_analysis.match_percentage:.1f}%")
+
+        with col2:
+            st.metric("Coverage Score", f"{role_analysis.skill_coverage_score}/10")
+
+        with col3:
+            st.metric("Jobs Analyzed", role_analysis.jobs_analyzed)
+
+        st.markdown(f"**Estimated Readiness:** {role_analysis.estimated_readiness}")
+
+        # Progress bar for match percentage
+        st.progress(role_analysis.match_percentage / 100)
+
+        # Matched Skills (one markdown block instead of a column grid
+        # with a widget per skill)
+        if role_analysis.matched_skills:
+            st.markdown("### ✅ Skills You Have")
+            st.markdown(blocks[f'matched_{idx - 1}'])
+
+        # Missing Skills (one dataframe for the whole list - a per-gap
+        # st.markdown is a ForwardMsg per gap per role)
+        if role_analysis.missing_skills:
+            st.markdown("### 🚨 Skills to Develop")
+            st.dataframe(blocks[f'missing_{idx - 1}'],
+                         use_container_width=True, hide_index=True)
+
+        # Top Skills to Learn
+        if role_analysis.top_skills_to_learn:
+            st.markdown("### 🎓 Recommended Learning Priority")
+            st.markdown(blocks[f'learn_{idx - 1}'])
+
+
+@st.fragment
+def _render_roadmap(skill_gap: SkillGapAnalysis):
+    """Learning roadmap, one timeframe at a time.
+
+    st.tabs builds every pane on each rerun; a segmented control inside
+    this fragment renders only the selected plan, so a timeframe switch
+    is a single small message.
+    """
+    st.subheader("📋 Your Learning Roadmap")
+
+    # Cache hit: the outer render already built the blocks for this analysis
+    blocks = _build_markdown_blocks(skill_gap.model_dump_json())
+
+    plans = {
+        "⚡ Immediate (2 weeks)": ("### Actions for Next 2 Weeks", 'immediate_actions', "No immediate actions"),
+        "📅 1 Month": ("### 1-Month Plan", 'one_month_plan', "No 1-month plan"),
+        "🎯 3 Months": ("### 3-Month Plan", 'three_month_plan', "No 3-month plan"),
+        "🚀 6 Months": ("### 6-Month Plan", 'six_month_plan', "No 6-month plan"),
+    }
+
+    selected = st.segmented_control(
+        "Timeframe",
+        options=list(plans),
+        default=next(iter(plans)),
+        key="roadmap_timeframe",
+        label_visibility="collapsed"
+    )
+
+    heading, key, empty_msg = plans[selected or next(iter(plans))]
+    if blocks[key]:
+        st.markdown(heading + "\n" + blocks[key])
+    else:
+        st.markdown(heading)
+        st.info(empty_msg)
@@ -1,8 +1,12 @@
 """Upload component utilities."""
 
+import shutil
+
 import streamlit as st
 from pathlib import Path
 
+_TEMP_DIR = Path("temp_uploads")
+
 
 def handle_file_upload():
     """Handle file upload logic."""
@@ -11,25 +15,29 @@ def handle_file_upload():
         type=['pdf', 'docx'],
         help="Upload your resume in PDF or DOCX format"
     )
-    
+
     return uploaded_file
 
 
 def save_uploaded_file(uploaded_file):
     """Save uploaded file temporarily.
-    
+
+    Streams the upload to disk in 1 MiB chunks instead of materializing
+    the whole file via getbuffer(), which copies it into memory first.
+
     Args:
         uploaded_file: Streamlit uploaded file object
-        
+
     Returns:
         Path to saved file
     """
-    temp_dir = Path("temp_uploads")
-    temp_dir.mkdir(exist_ok=True)
-    
-    file_path = temp_dir / uploaded_file.name
-    
+    _TEMP_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Basename only - strips any path components from the client filename
+    file_path = _TEMP_DIR / Path(uploaded_file.name).name
+
+    uploaded_file.seek(0)
     with open(file_path, 'wb') as f:
-        f.write(uploaded_file.getbuffer())
-    
+        shutil.copyfileobj(uploaded_file, f, length=1024 * 1024)
+
     return file_path
@@ -0,0 +1,38 @@
+"""Process-wide shared resources for the Streamlit UI.
+
+Streamlit reruns the script top-to-bottom on every interaction, so anything
+constructed inline (database connections, API clients) is rebuilt constantly.
+The factories here are wrapped in ``st.cache_resource`` so each resource is
+created once per process and shared across sessions and reruns.
+"""
+
+import streamlit as st
+
+from src.document_store import DocumentStore
+from src.jobs.job_store import JobStore
+
+
+@st.cache_resource
+def get_doc_store() -> DocumentStore:
+    """Return the shared DocumentStore connection.
+
+    WAL mode lets the sidebar/stats readers run without blocking the
+    analysis writer; synchronous=NORMAL is safe under WAL and skips an
+    fsync per commit.
+    """
+    store = DocumentStore(check_same_thread=False)
+    store.conn.execute("PRAGMA journal_mode=WAL")
+    store.conn.execute("PRAGMA synchronous=NORMAL")
+    store.conn.execute("PRAGMA temp_store=MEMORY")
+    return store
+
+
+@st.cache_resource
+def get_job_store() -> JobStore:
+    """Return the shared JobStore.
+
+    Instantiation runs the CREATE TABLE IF NOT EXISTS schema checks, which
+    is pure overhead when repeated on every rerun. JobStore opens a fresh
+    connection per operation, so sharing the instance across threads is safe.
+    """
+    return JobStore()
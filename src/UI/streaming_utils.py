@@ -1,110 +1,80 @@
 """Utilities for handling LLM streaming in Streamlit."""
 
+import time
+
 import streamlit as st
-from datetime import time
 from typing import Callable, Any
 
 
 class StreamlitTokenHandler:
-    """Handle LLM token streaming in Streamlit UI."""
-    
+    """Handle LLM token streaming in Streamlit UI.
+
+    Tokens accumulate in a list buffer (appending to a str is O(n) per
+    token, O(n^2) over a long stream) and the display is refreshed at
+    most ~15 times a second - each refresh is a full round-trip to the
+    browser, so per-token updates would flood the WebSocket.
+    """
+
+    FLUSH_INTERVAL_S = 1 / 15
+
     def __init__(self, container, prefix=""):
         """Initialize handler.
-        
+
         Args:
             container: Streamlit container to display tokens
             prefix: Optional prefix text to show before tokens
         """
         self.container = container
         self.prefix = prefix
-        self.accumulated_text = ""
+        self._parts = []
+        self._last_flush = 0.0
         self.placeholder = container.empty()
-        
+
         # Display prefix if provided
         if prefix:
             self.placeholder.markdown(f"**{prefix}**\n\n")
-    
+
+    @property
+    def accumulated_text(self) -> str:
+        """Complete text received so far."""
+        return "".join(self._parts)
+
     def on_token(self, token: str):
         """Callback for each new token.
-        
+
         Args:
             token: New token from LLM
         """
-        self.accumulated_text += token
-        
-        # Update display with accumulated text
-        display_text = f"**{self.prefix}**\n\n{self.accumulated_text}" if self.prefix else self.accumulated_text
+        self._parts.append(token)
+
+        now = time.monotonic()
+        if now - self._last_flush < self.FLUSH_INTERVAL_S:
+            return
+        self._last_flush = now
+
+        text = "".join(self._parts)
+        display_text = f"**{self.prefix}**\n\n{text}" if self.prefix else text
         self.placeholder.markdown(display_text)
-    
+
     def finalize(self, final_text: str = None):
         """Finalize streaming and display complete text.
-        
+
+        Always renders, so tokens held back by the rate limit are shown.
+
         Args:
             final_text: Optional final text to display (uses accumulated if not provided)
         """
         text_to_display = final_text if final_text else self.accumulated_text
-        
+
         if self.prefix:
             self.placeholder.markdown(f"**{self.prefix}**\n\n{text_to_display}")
         else:
             self.placeholder.markdown(text_to_display)
-    
+
     def clear(self):
         """Clear the display."""
         self.placeholder.empty()
 
-def simulate_streaming_from_cache(
-    container,
-    cached_text: str,
-    prefix: str = "",
-    chars_per_token: int = 4,
-    delay_ms: int = 30
-):
-    """Simulate LLM streaming by displaying cached text gradually.
-    
-    This creates the illusion of streaming for cached results,
-    providing immediate feedback while maintaining UX consistency.
-    
-    Args:
-        container: Streamlit container to display in
-        cached_text: Pre-generated text from cache
-        prefix: Optional prefix text
-        chars_per_token: Characters per simulated token (controls speed)
-        delay_ms: Delay between tokens in milliseconds
-        
-    Returns:
-        Complete cached text
-    """
-    import time
-    
-    placeholder = container.empty()
-    
-    # Display prefix
-    if prefix:
-        placeholder.markdown(f"**{prefix}**\n\n")
-        time.sleep(0.3)
-    
-    # Simulate token-by-token display
-    accumulated = ""
-    for i in range(0, len(cached_text), chars_per_token):
-        accumulated = cached_text[:i + chars_per_token]
-        
-        if prefix:
-            placeholder.markdown(f"**{prefix}**\n\n{accumulated}")
-        else:
-            placeholder.markdown(accumulated)
-        
-        time.sleep(delay_ms / 1000.0)  # Convert to seconds
-    
-    # Ensure complete text is displayed
-    if prefix:
-        placeholder.markdown(f"**{prefix}**\n\n{cached_text}")
-    else:
-        placeholder.markdown(cached_text)
-    
-    return cached_text
-
-
 def create_analysis_section(title: str, icon: str = "🤖", expanded: bool = True):
     """Create an expandable section for LLM analysis.
     
@@ -122,6 +92,42 @@ def create_analysis_section(title: str, icon: str = "🤖", expanded: bool = Tru
     return expander, container
 
 
+class _ProgressThrottle:
+    """Coalesce progress updates so each one costs a widget diff + frame.
+
+    Every progress bump triggers a Streamlit rerender and a WebSocket
+    frame; sub-second micro-bumps are pure overhead. Only emit when the
+    bar moved at least MIN_PCT_STEP points or MIN_INTERVAL_S has passed.
+    """
+
+    MIN_PCT_STEP = 5
+    MIN_INTERVAL_S = 0.1
+
+    def __init__(self):
+        self.last_emit_ts = 0.0
+        self.last_pct = -1
+
+    def should_emit(self, progress_value: int) -> bool:
+        now = time.monotonic()
+
+        # A backwards jump means a new run started - always emit and reset
+        if progress_value < self.last_pct:
+            self.last_pct = progress_value
+            self.last_emit_ts = now
+            return True
+
+        if (progress_value - self.last_pct >= self.MIN_PCT_STEP
+                or now - self.last_emit_ts >= self.MIN_INTERVAL_S):
+            self.last_pct = progress_value
+            self.last_emit_ts = now
+            return True
+
+        return False
+
+
+_progress_throttle = _ProgressThrottle()
+
+
 def show_streaming_progress(
     step_name: str,
     progress_value: int,
@@ -129,12 +135,18 @@ def show_streaming_progress(
     progress_placeholder
 ):
     """Update streaming progress indicators.
-    
+
+    Updates that bump the bar less than 5 points within 100 ms of the
+    previous emit are dropped (see _ProgressThrottle).
+
     Args:
         step_name: Name of current step
         progress_value: Progress percentage (0-100)
         status_placeholder: Streamlit placeholder for status text
         progress_placeholder: Streamlit placeholder for progress bar
     """
+    if not _progress_throttle.should_emit(progress_value):
+        return
+
     status_placeholder.text(f"⚡ {step_name}...")
     progress_placeholder.progress(progress_value)
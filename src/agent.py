@@ -1,5 +1,6 @@
 """Main LangGraph agent for job search assistance with Ollama."""
 
+import logging
 import os
 import sys
 from pathlib import Path
@@ -7,8 +8,11 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+
+import httpx
 from langgraph.graph import StateGraph, END
-from langchain_ollama import ChatOllama
 from langchain_core.messages import HumanMessage, SystemMessage
 from typing import Dict, Any, List, Optional
 
@@ -24,7 +28,7 @@ from src.callbacks import StreamingCallbackHandler
 from pydantic import BaseModel
 from src.enhanced_resume_parser import EnhancedResumeParser
 from src.document_store import DocumentStore
-from src.utils import hash_file
+from src.utils import hash_file, get_staging_dir, quick_fingerprint_bytes, staging_path
 
 # ===== NEW IMPORTS FOR PHASE 2 =====
 from src.api.job_api_client import JobAPIClient
@@ -35,24 +39,115 @@ from src.csv_job_exporter import CSVJobExporter
 from src.email_sender import EmailSender
 
 
-def _handle_streaming_error(self, error: Exception, operation_name: str) -> Dict[str, Any]:
-    """Centralized error handling for streaming operations.
-    
-    Args:
-        error: Exception that occurred
-        operation_name: Name of operation that failed
-        
-    Returns:
-        Error state dictionary
-    """
-    error_msg = f"{operation_name} failed: {str(error)}"
-    self.logger.error(error_msg)
-    
-    return {
-        'error': error_msg,
-        'current_step': f"{operation_name.lower().replace(' ', '_')}_failed",
-        'messages': [HumanMessage(content=error_msg)]
-    }
+# JSON Schemas derived once at import. The streaming paths hand these to
+# Ollama's native structured-output format parameter, which constrains
+# decoding to the declared fields - tighter than the generic 'json' mode
+# and with no per-call model_json_schema() rebuild.
+_ROLE_MATCH_LIST_SCHEMA = {'type': 'array', 'items': JobRoleMatch.model_json_schema()}
+_RESUME_SUMMARY_SCHEMA = ResumeSummary.model_json_schema()
+
+# Connection settings shared by every Ollama client: keep sockets alive
+# between calls so repeated requests - including the parallel fan-out -
+# reuse warm TCP connections instead of paying a handshake each time.
+_OLLAMA_CLIENT_KWARGS = {
+    'limits': httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60),
+}
+
+# Immutable system prompts, built once as message objects instead of per
+# call - the content never varies between requests. The _JSON variants
+# spell out the output schema for the streaming paths, which run without
+# with_structured_output.
+_ROLES_SYSTEM_MSG = SystemMessage(content="""You are an experienced career coach with deep knowledge of job markets and roles.
+
+Based on the candidate's resume, identify the TOP 3 job roles they are best suited for.
+For each role, provide:
+1. Role title
+2. Confidence score (0.0 to 1.0) - how well the candidate fits
+3. Detailed reasoning for the recommendation
+4. Key skills from their resume that match this role
+
+Consider:
+- Years of experience
+- Technical skills
+- Domain expertise
+- Career progression
+- Industry trends
+
+Be realistic and specific in your recommendations.""")
+
+_SUMMARY_SYSTEM_MSG = SystemMessage(content="""You are an expert resume reviewer and editor.
+
+Provide a comprehensive summary and quality assessment:
+1. Overall summary of the candidate's profile (2-3 sentences)
+2. Total years of experience
+3. Key strengths (top 3-5)
+4. Grammatical and text correctness issues found
+5. Improvement suggestions
+6. Overall quality score (0-10)
+
+Be constructive, specific, and actionable in your feedback.""")
+
+_ROLES_JSON_SYSTEM_MSG = SystemMessage(content="""You are an experienced career coach with deep knowledge of job markets and roles.
+
+Based on the candidate's resume, identify the TOP 3 job roles they are best suited for.
+For each role, provide:
+1. Role title
+2. Confidence score (0.0 to 1.0) - how well the candidate fits
+3. Detailed reasoning for the recommendation
+4. Key skills from their resume that match this role
+
+Consider:
+- Years of experience
+- Technical skills
+- Domain expertise
+- Career progression
+- Industry trends
+
+IMPORTANT: Format your response as a valid JSON array of objects with these exact fields:
+- role_title (string)
+- confidence_score (number between 0.0 and 1.0)
+- reasoning (string)
+- key_matching_skills (array of strings)
+
+Example format:
+[
+{
+    "role_title": "Senior Data Engineer",
+    "confidence_score": 0.92,
+    "reasoning": "Strong experience in...",
+    "key_matching_skills": ["Python", "SQL", "AWS"]
+}
+]
+
+Be realistic and specific in your recommendations.""")
+
+_SUMMARY_JSON_SYSTEM_MSG = SystemMessage(content="""You are an expert resume reviewer and editor.
+
+Provide a comprehensive summary and quality assessment in JSON format with these exact fields:
+- overall_summary (string): 2-3 sentence summary of candidate's profile
+- years_of_experience (integer): Total years of professional experience
+- key_strengths (array of strings): Top 3-5 strengths
+- grammatical_issues (array of strings): Grammar and formatting issues found
+- improvement_suggestions (array of strings): Specific actionable suggestions
+- quality_score (number): Overall score from 0 to 10
+
+Example format:
+{
+"overall_summary": "Experienced data professional with...",
+"years_of_experience": 5,
+"key_strengths": ["Strong technical skills", "Leadership experience"],
+"grammatical_issues": ["Inconsistent tense in bullets"],
+"improvement_suggestions": ["Add metrics to achievements"],
+"quality_score": 7.5
+}
+
+Be constructive, specific, and actionable in your feedback.""")
+
+
+class _JobRoleMatches(BaseModel):
+    """List wrapper for structured job-role output. Module scope so
+    LangChain's schema conversion for it is done once, not per request."""
+    matches: List[JobRoleMatch]
 
 
 class JobSearchAgent:
@@ -72,20 +167,40 @@ class JobSearchAgent:
         # Initialize streaming callback
         self.callback_handler = StreamingCallbackHandler()
         
+        # Imported here rather than at module top: the Ollama client pulls
+        # in a sizable dependency graph, and importing this module doesn't
+        # always mean constructing an agent
+        from langchain_ollama import ChatOllama
+
         # Initialize Ollama LLM with streaming
         self.llm = ChatOllama(
             model=model_name or settings.ollama_model,
             base_url=settings.ollama_base_url,
             temperature=settings.temperature,
             streaming=True,  # Enable streaming
-            callbacks=[self.callback_handler]
+            callbacks=[self.callback_handler],
+            # Keep the model resident between requests so only the very
+            # first call (absorbed by the warm-up ping) pays the load cost
+            keep_alive=settings.ollama_keep_alive,
+            client_kwargs=_OLLAMA_CLIENT_KWARGS
         )
         
         self.logger.info(f"✅ Initialized Ollama with model: {model_name or settings.ollama_model}")
-        
-        self.drive_handler = GoogleDriveHandler()
+
+        # Persistent response cache: identical prompt + model config pairs
+        # (reruns, repeated analyses of the same resume) skip inference
+        if settings.llm_cache_enabled:
+            from langchain_core.globals import set_llm_cache
+            from src.llm_cache import SQLiteLLMCache
+            set_llm_cache(SQLiteLLMCache())
+
+        # Structured-output bindings, built once: with_structured_output
+        # wires up a fresh Runnable + parser on every call
+        self._roles_chain = self.llm.with_structured_output(_JobRoleMatches)
+        self._summary_chain = self.llm.with_structured_output(ResumeSummary)
+
         self.text_extractor = ResumeTextExtractor()
-        self.downloaded_files = []  # Track downloaded files for cleanup
+        self.downloaded_files = set()  # Track downloaded files for cleanup (dedupes re-downloads)
         
         # ===== NEW: Initialize Phase 2 components =====
         self.job_api_client = None  # Lazy initialization
@@ -94,9 +209,56 @@ class JobSearchAgent:
         self.skill_gap_analyzer = None
         
         self.workflow = self._build_graph()
-        
+
+        if settings.ollama_warmup_on_init:
+            self._warmup_llm()
+
         self.logger.info("✅ Agent initialization complete")
-    
+
+    @cached_property
+    def drive_handler(self) -> GoogleDriveHandler:
+        """Google Drive client, built on first use.
+
+        Construction loads service-account credentials and builds the API
+        client, and raises when credentials are missing - runs that never
+        touch Drive (pre-staged uploads, cache hits on known file
+        versions) shouldn't pay or require any of that at agent init.
+        """
+        return GoogleDriveHandler()
+
+    def _warmup_llm(self):
+        """Ping Ollama in the background so the model is loaded early.
+
+        The first real call otherwise pays the full model-load cost
+        (weights into RAM/VRAM). Runs on a daemon thread so construction
+        isn't blocked, and failures (e.g. Ollama not running) are ignored
+        - the real call will surface them.
+        """
+        def ping():
+            try:
+                self.llm.invoke([HumanMessage(content="ok")])
+                self.logger.debug("Ollama warm-up complete")
+            except Exception as e:
+                self.logger.debug(f"Ollama warm-up skipped: {e}")
+
+        import threading
+        threading.Thread(target=ping, name="ollama-warmup", daemon=True).start()
+
+    def set_token_callback(self, token_callback) -> None:
+        """Route streamed LLM tokens from the graph nodes to a callback.
+
+        self.llm is built with streaming=True and the shared callback
+        handler attached, so even blocking structured .invoke() calls
+        emit tokens through it as they arrive; pointing the handler at a
+        UI callback (e.g. StreamlitTokenHandler.on_token) gives
+        progressive display without a separate streaming code path.
+        Pass None to detach.
+
+        Args:
+            token_callback: Callable taking the new token string, or None
+        """
+        self.callback_handler.on_token_callback = token_callback
+
     def _initialize_phase2_components(self):
         """Lazy initialization of Phase 2 components (only when needed)."""
         if self.job_api_client is None:
@@ -141,13 +303,25 @@ class JobSearchAgent:
         
         # ===== PHASE 1 EDGES (EXISTING) =====
         workflow.set_entry_point("download_resume")
-        workflow.add_edge("download_resume", "parse_resume")
-        workflow.add_edge("parse_resume", "analyze_job_roles")
-        workflow.add_edge("analyze_job_roles", "generate_summary")
-    
-        
+
+        # Nodes record failures in state['error'] instead of raising; route
+        # straight to END when it is set, so a failed download or parse
+        # doesn't fall through to the LLM calls with incomplete state
+        def _continue_or_end(targets):
+            def route(state: AgentState):
+                return END if state.get("error") else targets
+            return route
+
+        workflow.add_conditional_edges("download_resume", _continue_or_end("parse_resume"))
+        # Role analysis and summary only depend on parse_resume, not on each
+        # other - fan them out so the two Ollama calls run concurrently and
+        # join before the job fetch
+        workflow.add_conditional_edges(
+            "parse_resume", _continue_or_end(["analyze_job_roles", "generate_summary"])
+        )
+
         # ===== PHASE 2 EDGES (NEW) =====
-        workflow.add_edge("generate_summary", "fetch_job_postings")
+        workflow.add_edge(["analyze_job_roles", "generate_summary"], "fetch_job_postings")
         workflow.add_edge("fetch_job_postings", "analyze_skill_gaps")
         workflow.add_edge("analyze_skill_gaps", "export_and_email")
         workflow.add_edge("export_and_email", END)
@@ -169,31 +343,32 @@ class JobSearchAgent:
             try:
                 self.logger.info(f"📥 Downloading resume: {state['file_name']}")
                 
-                # Create temp directory in project root
-                temp_dir = Path("temp_resumes")
-                temp_dir.mkdir(exist_ok=True)
-                
-                # Save to temp directory instead of project root
-                temp_file_path = temp_dir / state['file_name']
-                
-                file_content = self.drive_handler.download_file(
-                    state["file_id"], 
-                    str(temp_file_path)
+                # Stage in the RAM-backed temp dir (hash/parse/extract all
+                # re-read this file before it is deleted), namespaced per
+                # file_id so concurrent runs can't collide on a shared name
+                temp_file_path = (
+                    Path(state['file_path']) if state.get('file_path')
+                    else staging_path(state['file_id'], state['file_name'])
                 )
-                
+
+                # process_resume and the UI both pre-stage the file at this
+                # path; only hit Drive when nothing staged it already
+                if temp_file_path.exists():
+                    self.logger.info("📦 Using pre-staged download")
+                else:
+                    self.drive_handler.download_file(
+                        state["file_id"],
+                        str(temp_file_path)
+                    )
+
                 # Track downloaded file for cleanup
-                self.downloaded_files.append(str(temp_file_path))
-                
-                # Extract text
-                self.logger.info("📄 Extracting text from resume...")
-                raw_text = self.text_extractor.extract_text(str(temp_file_path))
-                
-                self.logger.info(f"✅ Extracted {len(raw_text)} characters, {len(raw_text.split())} words")
-                
+                self.downloaded_files.add(str(temp_file_path))
+
+                # Text extraction happens in the parse node, which reuses the
+                # same pdfplumber pass that produces the structured resume
                 return {
-                    "raw_resume_text": raw_text,
+                    "file_path": str(temp_file_path),
                     "current_step": "download_complete",
-                    "messages": [HumanMessage(content=f"Downloaded and extracted text from {state['file_name']}")],
                 }
             except Exception as e:
                 self.logger.error(f"Download/Extraction failed: {str(e)}")
@@ -220,7 +395,10 @@ class JobSearchAgent:
                 if not file_name:
                     raise ValueError("No file_name in state")
             
-                temp_file_path = Path("temp_resumes") / file_name
+                temp_file_path = (
+                    Path(state['file_path']) if state.get('file_path')
+                    else get_staging_dir() / file_name
+                )
 
                 # Check if file exists
                 if not temp_file_path.exists():
@@ -241,8 +419,13 @@ class JobSearchAgent:
                 
                 return {
                     "parsed_resume": parsed_resume,
+                    # Serialized once, compact: both LLM nodes embed this in
+                    # their prompts, and indentation or null-valued fields
+                    # only add prompt tokens
+                    "parsed_resume_json": parsed_resume.model_dump_json(exclude_none=True),
+                    "raw_resume_text": parser.raw_text or state.get('raw_resume_text', ''),
+                    "raw_resume_text_preview": (parser.raw_text or state.get('raw_resume_text', ''))[:3000],
                     "current_step": "parsing_complete",
-                    "messages": [HumanMessage(content="Resume parsed successfully with PDFPlumber")],
                 }
             except Exception as e:
                 self.logger.error(f"Parsing failed: {str(e)}")
@@ -261,54 +444,34 @@ class JobSearchAgent:
             Updated state dictionary
         """
         with self.logger.timer("Analyze Job Roles"):
-            system_prompt = """You are an experienced career coach with deep knowledge of job markets and roles.
-
-Based on the candidate's resume, identify the TOP 3 job roles they are best suited for.
-For each role, provide:
-1. Role title
-2. Confidence score (0.0 to 1.0) - how well the candidate fits
-3. Detailed reasoning for the recommendation
-4. Key skills from their resume that match this role
-
-Consider:
-- Years of experience
-- Technical skills
-- Domain expertise
-- Career progression
-- Industry trends
-
-Be realistic and specific in your recommendations."""
-            
-            resume_json = state['parsed_resume'].model_dump_json(indent=2)
+            resume_json = state['parsed_resume_json']
             user_prompt = f"""Analyze this resume and recommend the top 3 job roles:
 
 {resume_json}
 
 Provide detailed analysis for each role."""
             
-            # Create a list model for structured output
-            class JobRoleMatches(BaseModel):
-                matches: List[JobRoleMatch]
-            
-            structured_llm = self.llm.with_structured_output(JobRoleMatches)
-            
+            structured_llm = self._roles_chain
+
             try:
                 self.logger.info("🎯 Analyzing suitable job roles with Ollama...")
                 self.logger.info("💭 LLM is evaluating career fit and generating recommendations...")
                 
                 result = structured_llm.invoke([
-                    SystemMessage(content=system_prompt),
+                    _ROLES_SYSTEM_MSG,
                     HumanMessage(content=user_prompt)
                 ])
                 
                 self.logger.info(f"✅ Generated {len(result.matches)} job role recommendations")
-                for idx, match in enumerate(result.matches, 1):
-                    self.logger.debug(f"  {idx}. {match.role_title} (confidence: {match.confidence_score:.2%})")
+                # Loop exists only to produce debug lines - skip it outright
+                # when debug logging is off
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    for idx, match in enumerate(result.matches, 1):
+                        self.logger.debug(f"  {idx}. {match.role_title} (confidence: {match.confidence_score:.2%})")
                 
                 return {
                     "job_role_matches": result.matches,
                     "current_step": "analysis_complete",
-                    "messages": [HumanMessage(content="Job role analysis complete")],
                 }
             except Exception as e:
                 self.logger.error(f"Analysis failed: {str(e)}")
@@ -327,36 +490,24 @@ Provide detailed analysis for each role."""
             Updated state dictionary
         """
         with self.logger.timer("Generate Resume Summary"):
-            system_prompt = """You are an expert resume reviewer and editor.
-
-Provide a comprehensive summary and quality assessment:
-1. Overall summary of the candidate's profile (2-3 sentences)
-2. Total years of experience
-3. Key strengths (top 3-5)
-4. Grammatical and text correctness issues found
-5. Improvement suggestions
-6. Overall quality score (0-10)
-
-Be constructive, specific, and actionable in your feedback."""
-            
-            resume_json = state['parsed_resume'].model_dump_json(indent=2)
+            resume_json = state['parsed_resume_json']
             user_prompt = f"""Review this resume and provide a comprehensive summary and quality assessment:
 
 {resume_json}
 
 Raw Resume Text (for grammar checking):
-{state['raw_resume_text'][:3000]}
+{state['raw_resume_text_preview']}
 
 Provide detailed feedback."""
             
-            structured_llm = self.llm.with_structured_output(ResumeSummary)
-            
+            structured_llm = self._summary_chain
+
             try:
                 self.logger.info("📊 Generating resume summary and quality assessment with Ollama...")
                 self.logger.info("💭 LLM is reviewing quality and generating improvement suggestions...")
                 
                 summary = structured_llm.invoke([
-                    SystemMessage(content=system_prompt),
+                    _SUMMARY_SYSTEM_MSG,
                     HumanMessage(content=user_prompt)
                 ])
                 
@@ -434,26 +585,58 @@ Provide detailed feedback."""
                 self.logger.info(f"   Employment type: {employment_type}")
                 self.logger.info(f"   Max results per role: {max_results}")
                 
-                all_jobs = []
-                
-                # Fetch jobs for each of the top 3 roles
-                for idx, job_role in enumerate(state['job_role_matches'][:3], 1):
-                    self.logger.info(f"📋 [{idx}/3] Fetching jobs for: {job_role.role_title}")
-                    
-                    try:
-                        jobs = self.job_api_client.search_jobs(
-                            job_title=job_role.role_title,
-                            country=country,
-                            posting_hours=posting_hours,
-                            employment_type=employment_type,
-                            max_results=max_results
-                        )
-                        all_jobs.extend(jobs)
-                        self.logger.info(f"    ✅ Found {len(jobs)} jobs")
-                    except Exception as e:
-                        self.logger.warning(f"    ⚠️  Failed to fetch jobs: {e}")
-                        continue
-                
+                # Check the short-TTL job cache first: identical role titles
+                # within the TTL window reuse the same postings instead of
+                # paying the multi-second API fan-out again
+                import hashlib
+                role_titles = [r.role_title for r in state['job_role_matches'][:3]]
+                job_key = hashlib.sha1(
+                    ("|".join(sorted(role_titles)) + "|" + country).encode()
+                ).hexdigest()
+
+                doc_store = DocumentStore()
+                try:
+                    cached_jobs = doc_store.get_cached_jobs(job_key)
+
+                    if cached_jobs is not None:
+                        all_jobs = [JobPosting.model_validate(j) for j in cached_jobs]
+                        self.logger.info(f"📦 Reusing {len(all_jobs)} cached job postings")
+                    else:
+                        all_jobs = []
+
+                        # Fetch jobs for the top 3 roles concurrently - each
+                        # role search is an independent network fan-out
+                        roles_to_fetch = state['job_role_matches'][:3]
+                        self.logger.info(f"📋 Fetching jobs for {len(roles_to_fetch)} roles concurrently")
+
+                        def _fetch_role_jobs(job_role):
+                            try:
+                                return self.job_api_client.search_jobs(
+                                    job_title=job_role.role_title,
+                                    country=country,
+                                    posting_hours=posting_hours,
+                                    employment_type=employment_type,
+                                    max_results=max_results
+                                )
+                            except Exception as e:
+                                self.logger.warning(f"    ⚠️  Failed to fetch jobs: {e}")
+                                return []
+
+                        with ThreadPoolExecutor(max_workers=len(roles_to_fetch)) as executor:
+                            for job_role, jobs in zip(
+                                roles_to_fetch,
+                                executor.map(_fetch_role_jobs, roles_to_fetch)
+                            ):
+                                all_jobs.extend(jobs)
+                                self.logger.info(f"    ✅ {job_role.role_title}: {len(jobs)} jobs")
+
+                        if all_jobs:
+                            doc_store.save_cached_jobs(
+                                job_key, [job.model_dump() for job in all_jobs]
+                            )
+                finally:
+                    doc_store.close()
+
                 self.logger.info(f"\n✅ Total jobs fetched: {len(all_jobs)}")
                 self.logger.info(f"   Sources: Adzuna, JSearch, Jooble")
                 
@@ -568,6 +751,18 @@ Provide detailed feedback."""
                 
                 # Extract resume skills
                 resume_skills = state['parsed_resume'].skills if state.get('parsed_resume') else []
+
+                # Prefer the pre-normalized skill set if the caller computed one
+                # (the UI does this once per analysis); use it to drop
+                # case-only duplicates before the O(jobs × skills) comparison
+                skills_lower = state.get('skills_lower') or frozenset(s.lower() for s in resume_skills)
+                if len(skills_lower) < len(resume_skills):
+                    seen = set()
+                    resume_skills = [
+                        s for s in resume_skills
+                        if not (s.lower() in seen or seen.add(s.lower()))
+                    ]
+
                 job_roles = [match.role_title for match in state['job_role_matches'][:3]]
                 
                 self.logger.info(f"📊 Analyzing skill gaps...")
@@ -641,41 +836,7 @@ Provide detailed feedback."""
             Updated state dictionary with structured job role matches
         """
         with self.logger.timer("Analyze Job Roles (Streaming)"):
-            system_prompt = """You are an experienced career coach with deep knowledge of job markets and roles.
-
-Based on the candidate's resume, identify the TOP 3 job roles they are best suited for.
-For each role, provide:
-1. Role title
-2. Confidence score (0.0 to 1.0) - how well the candidate fits
-3. Detailed reasoning for the recommendation
-4. Key skills from their resume that match this role
-
-Consider:
-- Years of experience
-- Technical skills
-- Domain expertise
-- Career progression
-- Industry trends
-
-IMPORTANT: Format your response as a valid JSON array of objects with these exact fields:
-- role_title (string)
-- confidence_score (number between 0.0 and 1.0)
-- reasoning (string)
-- key_matching_skills (array of strings)
-
-Example format:
-[
-{
-    "role_title": "Senior Data Engineer",
-    "confidence_score": 0.92,
-    "reasoning": "Strong experience in...",
-    "key_matching_skills": ["Python", "SQL", "AWS"]
-}
-]
-
-Be realistic and specific in your recommendations."""
-            
-            resume_json = state['parsed_resume'].model_dump_json(indent=2)
+            resume_json = state.get('parsed_resume_json') or state['parsed_resume'].model_dump_json(exclude_none=True)
             user_prompt = f"""Analyze this resume and recommend the top 3 job roles:
 
 {resume_json}
@@ -689,18 +850,21 @@ Provide detailed analysis for each role in JSON format."""
                 streaming_callback = StreamingCallbackHandler(on_token_callback=token_callback)
                 
                 # Create LLM WITHOUT structured output for streaming
+                from langchain_ollama import ChatOllama
                 streaming_llm = ChatOllama(
                     model=self.llm.model,
                     base_url=self.llm.base_url,
                     temperature=self.llm.temperature,
                     streaming=True,
                     callbacks=[streaming_callback],
-                    format='json'
+                    format=_ROLE_MATCH_LIST_SCHEMA,
+                    keep_alive=self.llm.keep_alive,
+                    client_kwargs=_OLLAMA_CLIENT_KWARGS
                 )
                 
                 # Stream the response
                 response = streaming_llm.invoke([
-                    SystemMessage(content=system_prompt),
+                    _ROLES_JSON_SYSTEM_MSG,
                     HumanMessage(content=user_prompt)
                 ])
                 
@@ -745,7 +909,6 @@ Provide detailed analysis for each role in JSON format."""
                 return {
                     "job_role_matches": job_matches,
                     "current_step": "analysis_complete",
-                    "messages": [HumanMessage(content="Job role analysis complete with streaming")],
                 }
                 
             except json.JSONDecodeError as e:
@@ -773,30 +936,8 @@ Provide detailed analysis for each role in JSON format."""
             Updated state dictionary with structured summary
         """
         with self.logger.timer("Generate Resume Summary (Streaming)"):
-            system_prompt = """You are an expert resume reviewer and editor.
-
-Provide a comprehensive summary and quality assessment in JSON format with these exact fields:
-- overall_summary (string): 2-3 sentence summary of candidate's profile
-- years_of_experience (integer): Total years of professional experience
-- key_strengths (array of strings): Top 3-5 strengths
-- grammatical_issues (array of strings): Grammar and formatting issues found
-- improvement_suggestions (array of strings): Specific actionable suggestions
-- quality_score (number): Overall score from 0 to 10
-
-Example format:
-{
-"overall_summary": "Experienced data professional with...",
-"years_of_experience": 5,
-"key_strengths": ["Strong technical skills", "Leadership experience"],
-"grammatical_issues": ["Inconsistent tense in bullets"],
-"improvement_suggestions": ["Add metrics to achievements"],
-"quality_score": 7.5
-}
-
-Be constructive, specific, and actionable in your feedback."""
-            
-            resume_json = state['parsed_resume'].model_dump_json(indent=2)
-            raw_text_preview = state.get('raw_resume_text', '')[:3000]
+            resume_json = state.get('parsed_resume_json') or state['parsed_resume'].model_dump_json(exclude_none=True)
+            raw_text_preview = state.get('raw_resume_text_preview') or state.get('raw_resume_text', '')[:3000]
             
             user_prompt = f"""Review this resume and provide a comprehensive summary and quality assessment:
 
@@ -814,18 +955,21 @@ Provide detailed feedback in JSON format."""
                 streaming_callback = StreamingCallbackHandler(on_token_callback=token_callback)
                 
                 # Create LLM WITHOUT structured output for streaming
+                from langchain_ollama import ChatOllama
                 streaming_llm = ChatOllama(
                     model=self.llm.model,
                     base_url=self.llm.base_url,
                     temperature=self.llm.temperature,
                     streaming=True,
                     callbacks=[streaming_callback],
-                    format='json'
+                    format=_RESUME_SUMMARY_SCHEMA,
+                    keep_alive=self.llm.keep_alive,
+                    client_kwargs=_OLLAMA_CLIENT_KWARGS
                 )
                 
                 # Stream the response
                 response = streaming_llm.invoke([
-                    SystemMessage(content=system_prompt),
+                    _SUMMARY_JSON_SYSTEM_MSG,
                     HumanMessage(content=user_prompt)
                 ])
                 
@@ -883,21 +1027,40 @@ Provide detailed feedback in JSON format."""
     
     # ===== CLEANUP & PROCESS METHODS =====
     
-    def cleanup_downloaded_files(self):
-        """Delete all downloaded resume files."""
+    def cleanup_downloaded_files(self, files: Optional[set] = None):
+        """Delete downloaded resume files.
+
+        Args:
+            files: Specific staged paths to delete; defaults to everything
+                tracked. Concurrent process_resumes runs pass their own
+                paths so one run's cleanup can't delete another's staging.
+        """
         self.logger.info("🗑️  Cleaning up downloaded files...")
-        
-        for filename in self.downloaded_files:
+
+        targets = set(files) if files is not None else set(self.downloaded_files)
+        for filename in targets:
+            # Unlink directly instead of exists()+remove(): one syscall per
+            # file, and no race window between the check and the delete
             try:
-                if os.path.exists(filename):
-                    os.remove(filename)
-                    self.logger.info(f"✅ Deleted: {filename}")
-                else:
-                    self.logger.warning(f"File not found for cleanup: {filename}")
+                os.unlink(filename)
+                self.logger.info(f"✅ Deleted: {filename}")
+            except FileNotFoundError:
+                self.logger.warning(f"File not found for cleanup: {filename}")
             except Exception as e:
                 self.logger.error(f"Failed to delete {filename}: {str(e)}")
         
-        self.downloaded_files.clear()
+        # Staged files live in per-file_id subdirectories; drop the ones
+        # this pass emptied (rmdir refuses non-empty dirs, so a concurrent
+        # run's staging is safe)
+        staging_root = get_staging_dir()
+        for parent in {Path(p).parent for p in targets}:
+            if parent != staging_root:
+                try:
+                    parent.rmdir()
+                except OSError:
+                    pass
+
+        self.downloaded_files -= targets
         self.logger.info("✅ Cleanup complete")
     
     def process_resume(self, file_id: str, file_name: str, enable_skill_gap: bool = True) -> Dict[str, Any]:
@@ -916,22 +1079,51 @@ Provide detailed feedback in JSON format."""
         with self.logger.timer("Total Resume Processing"):
             # Initialize document store
             doc_store = DocumentStore()
+            # Paths staged by THIS run, so the finally-cleanup can't touch
+            # files a concurrent process_resumes run is still reading
+            run_files = set()
             
             try:
                 # Step 1: Download the resume
                 self.logger.info(f"📥 Downloading resume: {file_name}")
                 
-                temp_dir = Path("temp_resumes")
-                temp_dir.mkdir(exist_ok=True)
-                temp_file_path = temp_dir / file_name
-                
-                file_content = self.drive_handler.download_file(file_id, str(temp_file_path))
-                self.downloaded_files.append(str(temp_file_path))
-                
-                # Step 2: Compute hash
-                with self.logger.timer("Compute Resume Hash"):
-                    resume_hash = hash_file(str(temp_file_path))
-                    self.logger.info(f"🔑 Resume hash: {resume_hash[:16]}...")
+                temp_file_path = staging_path(file_id, file_name)
+                resume_hash = None
+                drive_version = None
+
+                if temp_file_path.exists():
+                    # Pre-staged by the caller (the UI overlaps the download
+                    # with agent initialization)
+                    self.logger.info("📦 Using pre-staged download")
+                    file_content = temp_file_path.read_bytes()
+                else:
+                    # Cheap metadata probe before the media download: an
+                    # unchanged content version means the bytes - and so the
+                    # cache key - match a previous run of this file_id.
+                    # md5Checksum identifies the content directly; Google
+                    # Docs exports don't have one, so fall back to modifiedTime
+                    metadata = self.drive_handler.get_file_metadata(file_id)
+                    drive_version = metadata.get('md5Checksum') or metadata.get('modifiedTime')
+                    if drive_version:
+                        resume_hash = doc_store.get_drive_file_hash(file_id, drive_version)
+
+                    if resume_hash:
+                        self.logger.info("📦 Drive file unchanged since last run - skipping download")
+                    else:
+                        file_content = self.drive_handler.download_file(
+                            file_id, str(temp_file_path)
+                        )
+                if temp_file_path.exists():
+                    run_files.add(str(temp_file_path))
+                    self.downloaded_files.add(str(temp_file_path))
+
+                # Step 2: Cheap cache key from the in-memory bytes
+                # (size + head/tail digest, no full-file hashing)
+                if resume_hash is None:
+                    resume_hash = quick_fingerprint_bytes(file_content)
+                    if drive_version:
+                        doc_store.save_drive_file_hash(file_id, drive_version, resume_hash)
+                self.logger.info(f"🔑 Resume hash: {resume_hash[:16]}...")
                 
                 # Step 3: Check cache
                 cached_data = doc_store.get_cached_resume(resume_hash)
@@ -947,7 +1139,7 @@ Provide detailed feedback in JSON format."""
                         "messages": [HumanMessage(content=f"Loaded cached analysis for {file_name}")],
                         "file_id": file_id,
                         "file_name": file_name,
-                        "raw_resume_text": "",
+                        "raw_resume_text": cached_data.get('raw_text') or "",
                         "parsed_resume": ParsedResume.model_validate(cached_data['parsed_data']) if cached_data['parsed_data'] else None,
                         "job_role_matches": [JobRoleMatch.model_validate(match) for match in cached_data['job_roles']] if cached_data['job_roles'] else None,
                         "resume_summary": ResumeSummary.model_validate(cached_data['summary']) if cached_data['summary'] else None,
@@ -993,26 +1185,26 @@ Provide detailed feedback in JSON format."""
                                 self.logger.debug(f"After export - email_sent: {export_state.get('email_sent')}")
                                 self.logger.debug(f"After export - csv_path: {export_state.get('csv_path')}")
                     
-                    # Cleanup and close
-                    self.cleanup_downloaded_files()
-                    doc_store.close()
-                    
                     return final_state
                 
                 # Step 4: No cache - run full pipeline
+                # (text extraction happens inside the parse node)
                 self.logger.log_section("🔄 PROCESSING NEW RESUME")
-                
-                # Extract text
-                self.logger.info("📄 Extracting text from resume...")
-                raw_text = self.text_extractor.extract_text(str(temp_file_path))
-                self.logger.info(f"✅ Extracted {len(raw_text)} characters")
-                
+
+                if not temp_file_path.exists():
+                    # Download was skipped on a metadata match but the cached
+                    # row is gone (e.g. cache cleared) - fetch the file after all
+                    self.drive_handler.download_file(file_id, str(temp_file_path))
+                    run_files.add(str(temp_file_path))
+                    self.downloaded_files.add(str(temp_file_path))
+
                 # Build initial state
                 initial_state = {
                     "messages": [HumanMessage(content=f"Processing {file_name}")],
                     "file_id": file_id,
                     "file_name": file_name,
-                    "raw_resume_text": raw_text,
+                    "file_path": str(temp_file_path),
+                    "raw_resume_text": "",
                     "parsed_resume": None,
                     "job_role_matches": None,
                     "resume_summary": None,
@@ -1036,22 +1228,65 @@ Provide detailed feedback in JSON format."""
                         file_name=file_name,
                         parsed_data=final_state['parsed_resume'].model_dump(),
                         job_roles=[match.model_dump() for match in final_state['job_role_matches']] if final_state.get('job_role_matches') else None,
-                        summary=final_state['resume_summary'].model_dump() if final_state.get('resume_summary') else None
+                        summary=final_state['resume_summary'].model_dump() if final_state.get('resume_summary') else None,
+                        raw_text=final_state.get('raw_resume_text')
                     )
                     
                     self.logger.info("✅ Phase 1 results cached")
-                
-                # Cleanup
-                self.cleanup_downloaded_files()
-                doc_store.close()
-                
+
+                # The full raw text is cache-persisted above; dropping it
+                # from the returned state saves O(resume length) bytes in
+                # everything downstream that holds onto the result
+                final_state.pop('raw_resume_text', None)
+
                 return final_state
-                
+
             except Exception as e:
                 self.logger.error(f"❌ Pipeline execution failed: {str(e)}")
-                self.cleanup_downloaded_files()
-                doc_store.close()
                 raise
+            finally:
+                # Runs on cache hit, miss and every error path alike, so
+                # staged downloads can't accumulate in the temp dir
+                self.cleanup_downloaded_files(run_files)
+                doc_store.close()
+
+    def process_resumes(self, files: List[Dict[str, str]], max_workers: int = 2) -> List[Dict[str, Any]]:
+        """Process several resumes concurrently.
+
+        Runs overlap each other's I/O (Drive downloads, job-board APIs)
+        and let the Ollama server pipeline LLM requests instead of paying
+        full serial latency per resume.
+
+        Args:
+            files: List of dicts with 'file_id' and 'file_name' keys
+            max_workers: Maximum concurrent pipeline runs
+
+        Returns:
+            Final states in the same order as files; a failed resume
+            yields an error dict instead of aborting the whole batch
+        """
+        if len(files) == 1:
+            return [self.process_resume(files[0]['file_id'], files[0]['file_name'])]
+
+        self.logger.log_section(f"BATCH PROCESSING {len(files)} RESUMES")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(self.process_resume, f['file_id'], f['file_name'])
+                for f in files
+            ]
+            results = []
+            for future, f in zip(futures, files):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    self.logger.error(f"Batch processing failed for {f['file_name']}: {e}")
+                    results.append({
+                        'file_name': f['file_name'],
+                        'error': str(e),
+                        'current_step': 'failed'
+                    })
+            return results
 
     def _export_and_email_results(self, state: AgentState) -> Dict[str, Any]:
         """Node: Export job recommendations to CSV and email to candidate."""
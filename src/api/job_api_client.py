@@ -2,6 +2,7 @@
 """Unified job API client with fallback logic and enhanced filters."""
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 from dotenv import load_dotenv
 
@@ -66,77 +67,47 @@ class JobAPIClient:
         logger.debug(f"  Employment type: {employment_type}")
         logger.debug(f"  Location: {location or 'Any'}")
         
-        all_jobs = []
-        
-        # ===== Try Adzuna first (best free tier) =====
-        try:
-            logger.debug("Trying Adzuna...")
-            adzuna_jobs = self.adzuna.search_jobs(
-                job_title=job_title,
-                country=country,
-                posting_hours=posting_hours,
-                employment_type=employment_type,
-                max_results=max_results,
-                location=location
-            )
-            
-            if adzuna_jobs:
-                all_jobs.extend(adzuna_jobs)
-                logger.info(f"✓ Adzuna: {len(adzuna_jobs)} jobs")
-            else:
-                logger.debug("✗ Adzuna: No jobs found")
-                
-        except Exception as e:
-            logger.warning(f"✗ Adzuna failed: {e}")
-        
-        # ===== Try JSearch if we need more results =====
-        if len(all_jobs) < max_results:
+        # ===== Query all three providers concurrently =====
+        # The providers are independent HTTP endpoints, so fanning them out
+        # makes total latency ~max(provider) instead of sum(provider)
+        def _fetch(provider_name: str, client) -> tuple:
             try:
-                remaining = max_results - len(all_jobs)
-                logger.debug(f"Trying JSearch (need {remaining} more)...")
-                
-                jsearch_jobs = self.jsearch.search_jobs(
+                logger.debug(f"Trying {provider_name}...")
+                jobs = client.search_jobs(
                     job_title=job_title,
                     country=country,
                     posting_hours=posting_hours,
                     employment_type=employment_type,
-                    max_results=remaining,
+                    max_results=max_results,
                     location=location
                 )
-                
-                if jsearch_jobs:
-                    all_jobs.extend(jsearch_jobs)
-                    logger.info(f"✓ JSearch: {len(jsearch_jobs)} jobs")
-                else:
-                    logger.debug("✗ JSearch: No jobs found")
-                    
+                return provider_name, jobs or []
             except Exception as e:
-                logger.warning(f"✗ JSearch failed: {e}")
-        
-        # ===== Try Jooble as last resort =====
-        if len(all_jobs) < max_results:
-            try:
-                remaining = max_results - len(all_jobs)
-                logger.debug(f"Trying Jooble (need {remaining} more)...")
-                
-                jooble_jobs = self.jooble.search_jobs(
-                    job_title=job_title,
-                    country=country,
-                    posting_hours=posting_hours,
-                    employment_type=employment_type,
-                    max_results=remaining,
-                    location=location
-                )
-                
-                if jooble_jobs:
-                    all_jobs.extend(jooble_jobs)
-                    logger.info(f"✓ Jooble: {len(jooble_jobs)} jobs")
-                else:
-                    logger.debug("✗ Jooble: No jobs found")
-                    
-            except Exception as e:
-                logger.warning(f"✗ Jooble failed: {e}")
-        
+                logger.warning(f"✗ {provider_name} failed: {e}")
+                return provider_name, []
+
+        providers = [
+            ('Adzuna', self.adzuna),
+            ('JSearch', self.jsearch),
+            ('Jooble', self.jooble),
+        ]
+
+        with ThreadPoolExecutor(max_workers=len(providers)) as executor:
+            results = dict(executor.map(lambda p: _fetch(*p), providers))
+
+        # Combine in the original precedence order (Adzuna > JSearch > Jooble)
+        # and stop adding once we have enough results
+        all_jobs = []
+        for provider_name, _ in providers:
+            jobs = results.get(provider_name, [])
+            if jobs:
+                logger.info(f"✓ {provider_name}: {len(jobs)} jobs")
+            else:
+                logger.debug(f"✗ {provider_name}: No jobs found")
+
+            if len(all_jobs) < max_results:
+                all_jobs.extend(jobs)
+
         # ===== Remove duplicates based on URL =====
         unique_jobs = []
         seen_urls = set()
@@ -17,6 +17,18 @@ class Settings(BaseSettings):
         default="http://localhost:11434",
         description="Ollama API base URL"
     )
+    ollama_warmup_on_init: bool = Field(
+        default=True,
+        description="Send a tiny request at agent init so the model is loaded before the first real call"
+    )
+    llm_cache_enabled: bool = Field(
+        default=True,
+        description="Cache LLM responses in SQLite keyed on prompt + model config"
+    )
+    ollama_keep_alive: int = Field(
+        default=-1,
+        description="How long Ollama keeps the model loaded after a request (-1 = indefinitely)"
+    )
     
     # ===== PHASE 1: GOOGLE DRIVE CONFIGURATION =====
     google_credentials_path: str = Field(
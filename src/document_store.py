@@ -2,32 +2,39 @@
 
 import sqlite3
 import json
+import zlib
 from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime
 
 from src.logger import get_logger
 
+# Bump when the on-disk payload encoding changes. v1 = plain JSON text,
+# v2 = zlib-compressed JSON blobs (smaller SQLite pages, less read I/O).
+SCHEMA_VERSION = 2
+
 
 class DocumentStore:
     """Persistent cache for parsed resume data using SQLite."""
     
-    def __init__(self, db_path: str = "db/resume_cache.db"):
+    def __init__(self, db_path: str = "db/resume_cache.db", check_same_thread: bool = True):
         """Initialize document store.
-        
+
         Args:
             db_path: Path to SQLite database file
+            check_same_thread: Passed through to sqlite3.connect; set False
+                when the store is shared across threads (e.g. Streamlit reruns)
         """
         self.db_path = Path(db_path)
         self.logger = get_logger()
         self.conn = None
-        self._connect()
+        self._connect(check_same_thread)
         self._create_tables()
-    
-    def _connect(self):
+
+    def _connect(self, check_same_thread: bool = True):
         """Establish database connection."""
         try:
-            self.conn = sqlite3.connect(str(self.db_path))
+            self.conn = sqlite3.connect(str(self.db_path), check_same_thread=check_same_thread)
             self.conn.row_factory = sqlite3.Row  # Access columns by name
             self.logger.debug(f"Connected to document store: {self.db_path}")
         except Exception as e:
@@ -59,10 +66,47 @@ class DocumentStore:
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
-        
+
+        # Migration: add raw_text to cache rows created before it existed
+        try:
+            cursor.execute("ALTER TABLE resume_cache ADD COLUMN raw_text TEXT")
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+
+        # Migration: payload encoding version (old rows default to 1 = JSON text)
+        try:
+            cursor.execute("ALTER TABLE resume_cache ADD COLUMN schema_version INTEGER DEFAULT 1")
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+
+        # Short-TTL cache for Phase 2 job postings, keyed by role-title hash
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS job_postings_cache (
+                job_key TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
         self.conn.commit()
         self.logger.debug("Document store tables initialized")
-    
+
+    @staticmethod
+    def _pack(payload: Optional[Any]) -> Optional[bytes]:
+        """Serialize a payload (dict or list) to a compressed blob (schema v2)."""
+        if payload is None:
+            return None
+        return zlib.compress(json.dumps(payload, ensure_ascii=False).encode('utf-8'), 6)
+
+    @staticmethod
+    def _unpack(value) -> Optional[Any]:
+        """Decode a payload column, handling both v1 (JSON text) and v2 (blob) rows."""
+        if value is None:
+            return None
+        if isinstance(value, bytes):
+            return json.loads(zlib.decompress(value).decode('utf-8'))
+        return json.loads(value)
+
     def get_cached_resume(self, resume_hash: str) -> Optional[Dict[str, Any]]:
         """Retrieve cached parsed resume data by hash.
         
@@ -75,7 +119,7 @@ class DocumentStore:
         try:
             cursor = self.conn.cursor()
             cursor.execute("""
-                SELECT resume_hash, file_name, parsed_data, job_roles, summary, created_at
+                SELECT resume_hash, file_name, parsed_data, job_roles, summary, raw_text, created_at
                 FROM resume_cache
                 WHERE resume_hash = ?
             """, (resume_hash,))
@@ -96,9 +140,10 @@ class DocumentStore:
                 return {
                     'resume_hash': row['resume_hash'],
                     'file_name': row['file_name'],
-                    'parsed_data': json.loads(row['parsed_data']) if row['parsed_data'] else None,
-                    'job_roles': json.loads(row['job_roles']) if row['job_roles'] else None,
-                    'summary': json.loads(row['summary']) if row['summary'] else None,
+                    'parsed_data': self._unpack(row['parsed_data']),
+                    'job_roles': self._unpack(row['job_roles']),
+                    'summary': self._unpack(row['summary']),
+                    'raw_text': row['raw_text'],
                     'created_at': row['created_at']
                 }
             
@@ -115,30 +160,35 @@ class DocumentStore:
         file_name: str,
         parsed_data: Dict[str, Any],
         job_roles: Optional[Dict[str, Any]] = None,
-        summary: Optional[Dict[str, Any]] = None
+        summary: Optional[Dict[str, Any]] = None,
+        raw_text: Optional[str] = None
     ):
         """Save parsed resume data to cache.
-        
+
         Args:
             resume_hash: SHA256 hash of the resume file
             file_name: Original filename
             parsed_data: Parsed resume Pydantic model as dict
             job_roles: Job role matches (optional)
             summary: Resume summary (optional)
+            raw_text: Extracted resume text (optional); cached so hits skip
+                re-running pdfplumber for Phase 2
         """
         try:
             cursor = self.conn.cursor()
-            
+
             cursor.execute("""
-                INSERT OR REPLACE INTO resume_cache 
-                (resume_hash, file_name, parsed_data, job_roles, summary, created_at, last_accessed)
-                VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+                INSERT OR REPLACE INTO resume_cache
+                (resume_hash, file_name, parsed_data, job_roles, summary, raw_text, schema_version, created_at, last_accessed)
+                VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
             """, (
                 resume_hash,
                 file_name,
-                json.dumps(parsed_data, ensure_ascii=False),
-                json.dumps(job_roles, ensure_ascii=False) if job_roles else None,
-                json.dumps(summary, ensure_ascii=False) if summary else None
+                self._pack(parsed_data),
+                self._pack(job_roles),
+                self._pack(summary),
+                raw_text,
+                SCHEMA_VERSION
             ))
             
             self.conn.commit()
@@ -147,6 +197,102 @@ class DocumentStore:
         except Exception as e:
             self.logger.error(f"Error saving to cache: {e}")
     
+    def get_cached_jobs(self, job_key: str, max_age_s: int = 3600) -> Optional[list]:
+        """Retrieve cached job postings if they are fresh enough.
+
+        Args:
+            job_key: Hash of the search parameters (role titles + location)
+            max_age_s: Maximum age in seconds before the entry is considered stale
+
+        Returns:
+            List of job posting dicts or None if missing/expired
+        """
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("""
+                SELECT payload
+                FROM job_postings_cache
+                WHERE job_key = ?
+                  AND created_at >= datetime('now', ?)
+            """, (job_key, f'-{int(max_age_s)} seconds'))
+
+            row = cursor.fetchone()
+
+            if row:
+                self.logger.info(f"Job cache HIT for key: {job_key[:12]}...")
+                return json.loads(row['payload'])
+
+            self.logger.info(f"Job cache MISS for key: {job_key[:12]}...")
+            return None
+
+        except Exception as e:
+            self.logger.error(f"Error retrieving jobs from cache: {e}")
+            return None
+
+    def save_cached_jobs(self, job_key: str, jobs: list):
+        """Save job postings to the short-TTL cache.
+
+        Args:
+            job_key: Hash of the search parameters (role titles + location)
+            jobs: List of job posting dicts (JobPosting.model_dump())
+        """
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("""
+                INSERT OR REPLACE INTO job_postings_cache (job_key, payload, created_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+            """, (job_key, json.dumps(jobs, ensure_ascii=False)))
+
+            self.conn.commit()
+            self.logger.info(f"Cached {len(jobs)} job postings for key: {job_key[:12]}...")
+
+        except Exception as e:
+            self.logger.error(f"Error saving jobs to cache: {e}")
+
+    def get_drive_file_hash(self, file_id: str, modified_time: str) -> Optional[str]:
+        """Look up the content hash recorded for a Drive file version.
+
+        Keyed on (file_id, modifiedTime): if the file has not changed on
+        Drive, its bytes - and therefore its cache key - are the same as
+        last time, so the caller can skip the media download entirely.
+
+        Args:
+            file_id: Google Drive file ID
+            modified_time: modifiedTime from Drive metadata
+
+        Returns:
+            Resume hash string or None if this version was never processed
+        """
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "SELECT value FROM cache_metadata WHERE key = ?",
+                (f"drive:{file_id}:{modified_time}",)
+            )
+            row = cursor.fetchone()
+            return row['value'] if row else None
+        except Exception as e:
+            self.logger.error(f"Error looking up drive file hash: {e}")
+            return None
+
+    def save_drive_file_hash(self, file_id: str, modified_time: str, resume_hash: str):
+        """Record the content hash for a Drive file version.
+
+        Args:
+            file_id: Google Drive file ID
+            modified_time: modifiedTime from Drive metadata
+            resume_hash: Content hash computed from the downloaded bytes
+        """
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("""
+                INSERT OR REPLACE INTO cache_metadata (key, value, updated_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+            """, (f"drive:{file_id}:{modified_time}", resume_hash))
+            self.conn.commit()
+        except Exception as e:
+            self.logger.error(f"Error saving drive file hash: {e}")
+
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics.
         
@@ -162,6 +162,7 @@ class EnhancedResumeParser:
     def __init__(self, file_path: str, debug: bool = False):
         self.file_path = file_path
         self.debug = debug
+        self.raw_text = None  # Populated by parse(); reusable by callers
         
     def extract_with_layout(self) -> List[Dict]:
         all_lines = []
@@ -566,6 +567,11 @@ class EnhancedResumeParser:
     
     def parse(self) -> ParsedResume:
         lines = self.extract_with_layout()
+
+        # Expose the text from this extraction pass so callers don't need a
+        # second pdfplumber run just to get the raw resume text
+        self.raw_text = "\n".join(line['text'] for line in lines)
+
         contact_info = self.extract_contact_info(lines)
         sections = self.segment_by_sections(lines)
         
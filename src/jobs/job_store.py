@@ -289,25 +289,35 @@ class JobStore:
         
         return saved_count
     
-    def get_session_jobs(self, session_id: str) -> List[Dict[str, Any]]:
+    def get_session_jobs(self, session_id: str, limit: Optional[int] = None,
+                         offset: int = 0) -> List[Dict[str, Any]]:
         """
-        Get all jobs for a specific session.
-        
+        Get jobs for a specific session.
+
         Args:
             session_id: Job search session ID
-            
+            limit: Optional maximum number of rows (applied server-side so
+                SQLite doesn't hydrate rows the caller would slice away)
+            offset: Number of rows to skip, for paging through large sessions
+
         Returns:
             List of job dictionaries
         """
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT * FROM job_recommendations 
-                WHERE session_id = ? 
+
+            query = """
+                SELECT * FROM job_recommendations
+                WHERE session_id = ?
                 ORDER BY created_at DESC
-            """, (session_id,))
-            
+            """
+            params: tuple = (session_id,)
+            if limit is not None:
+                query += " LIMIT ? OFFSET ?"
+                params = (session_id, limit, offset)
+
+            cursor.execute(query, params)
+
             rows = cursor.fetchall()
             
             jobs = []
@@ -490,42 +500,75 @@ class JobStore:
             
             logger.debug(f"Updated market readiness for {session_id}: {market_readiness}%")
 
-    def get_all_sessions(self, limit: int = 50) -> List[Dict]:
-        """Get all job search sessions."""
-        try:
-            cursor = self.conn.cursor()
-            
+    def get_all_sessions_with_counts(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Get all job search sessions with their job counts in one query.
+
+        A single LEFT JOIN + GROUP BY replaces per-session COUNT round
+        trips, so listing N sessions costs one query instead of N+1.
+
+        Args:
+            limit: Maximum number of sessions to return
+
+        Returns:
+            List of session dictionaries including a jobs_count key
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+
             cursor.execute("""
-                SELECT 
-                    js.session_id,
-                    js.resume_filename,
-                    js.candidate_name,
-                    js.created_at,
-                    js.market_readiness,
-                    COUNT(j.id) as jobs_count
-                FROM job_search_sessions js
-                LEFT JOIN jobs j ON js.session_id = j.session_id
-                GROUP BY js.session_id
-                ORDER BY js.created_at DESC
+                SELECT
+                    s.session_id,
+                    s.resume_filename,
+                    s.candidate_name,
+                    s.created_at,
+                    s.market_readiness,
+                    COUNT(j.job_id) as jobs_count
+                FROM job_search_sessions s
+                LEFT JOIN job_recommendations j ON s.session_id = j.session_id
+                GROUP BY s.session_id
+                ORDER BY s.created_at DESC
                 LIMIT ?
             """, (limit,))
-            
-            sessions = []
-            for row in cursor.fetchall():
-                sessions.append({
-                    'session_id': row[0],
-                    'resume_filename': row[1],
-                    'candidate_name': row[2],
-                    'created_at': row[3],
-                    'market_readiness': row[4],
-                    'jobs_count': row[5]
-                })
-            
-            return sessions
-            
-        except Exception as e:
-            self.logger.error(f"Failed to get sessions: {e}")
-            return []
+
+            sessions = [dict(row) for row in cursor.fetchall()]
+
+            logger.debug(f"Retrieved {len(sessions)} sessions with counts")
+
+        return sessions
+
+    def get_recent_sessions_rows(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Get recent sessions pre-formatted for display.
+
+        Column aliasing and the market-readiness percent formatting happen
+        in SQL, so the UI can hand the rows straight to st.dataframe with
+        no per-row Python reshaping on rerun.
+
+        Args:
+            limit: Maximum number of sessions to return
+
+        Returns:
+            List of display-ready row dictionaries
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                SELECT
+                    search_date AS "Date",
+                    resume_filename AS "Resume",
+                    total_jobs_found AS "Jobs Found",
+                    COALESCE(
+                        CAST(NULLIF(market_readiness, 0) AS TEXT) || '%',
+                        'N/A'
+                    ) AS "Market Readiness"
+                FROM job_search_sessions
+                ORDER BY search_date DESC
+                LIMIT ?
+            """, (limit,))
+
+            return [dict(row) for row in cursor.fetchall()]
 
 
 
@@ -0,0 +1,98 @@
+"""SQLite-backed response cache for LLM calls.
+
+Identical prompts against the same model/parameters (e.g. re-analyzing a
+resume after a UI tweak, or reruns during development) otherwise pay the
+full inference cost again. Keys are sha256(prompt + llm_string), where
+llm_string is LangChain's serialized model configuration, so a model or
+temperature change never serves stale responses.
+"""
+
+import hashlib
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Sequence
+
+from langchain_core.caches import BaseCache, RETURN_VAL_TYPE
+from langchain_core.load import dumps, loads
+
+from src.logger import get_logger
+
+
+class SQLiteLLMCache(BaseCache):
+    """Persistent prompt->response cache using SQLite.
+
+    Opens a short-lived connection per operation (same pattern as
+    JobStore), so a single instance is safe to share across the threads
+    LangGraph uses for parallel nodes.
+    """
+
+    def __init__(self, db_path: str = "db/llm_cache.db"):
+        """Initialize cache and create the table if needed.
+
+        Args:
+            db_path: Path to SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.logger = get_logger()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+        self.logger.debug(f"LLM response cache ready: {self.db_path}")
+
+    @contextmanager
+    def _get_connection(self):
+        """Yield a per-operation connection, committed and closed on exit."""
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _make_key(prompt: str, llm_string: str) -> str:
+        """Stable key covering both the prompt and the model config."""
+        return hashlib.sha256(f"{llm_string}\x00{prompt}".encode()).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """Return the cached generations for this prompt, if any."""
+        key = self._make_key(prompt, llm_string)
+        try:
+            with self._get_connection() as conn:
+                row = conn.execute(
+                    "SELECT response FROM llm_cache WHERE cache_key = ?", (key,)
+                ).fetchone()
+            if row is None:
+                return None
+            self.logger.debug(f"LLM cache hit: {key[:12]}")
+            return loads(row[0])
+        except Exception as e:
+            # A cache miss is always safe; a cache failure shouldn't be fatal
+            self.logger.warning(f"LLM cache lookup failed: {e}")
+            return None
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE):
+        """Store generations for this prompt/model pair."""
+        key = self._make_key(prompt, llm_string)
+        try:
+            with self._get_connection() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (cache_key, response) VALUES (?, ?)",
+                    (key, dumps(list(return_val)))
+                )
+        except Exception as e:
+            self.logger.warning(f"LLM cache update failed: {e}")
+
+    def clear(self, **kwargs):
+        """Drop all cached responses."""
+        with self._get_connection() as conn:
+            conn.execute("DELETE FROM llm_cache")
+        self.logger.info("LLM response cache cleared")
@@ -89,25 +89,38 @@ class AgentLogger:
         
         self.debug(f"Logging initialized. Log file: {log_file}")
     
-    def debug(self, message: str):
-        """Log debug message."""
-        self.logger.debug(message)
+    def debug(self, message: str, *args):
+        """Log debug message.
+
+        Extra args are passed through for %-style formatting, which the
+        logging module defers until the record is actually emitted - so
+        suppressed messages cost no string building.
+        """
+        self.logger.debug(message, *args)
     
-    def info(self, message: str):
+    def info(self, message: str, *args):
         """Log info message."""
-        self.logger.info(message)
+        self.logger.info(message, *args)
     
-    def warning(self, message: str):
+    def warning(self, message: str, *args):
         """Log warning message."""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
     
-    def error(self, message: str):
+    def error(self, message: str, *args):
         """Log error message."""
-        self.logger.error(message)
+        self.logger.error(message, *args)
     
-    def critical(self, message: str):
+    def critical(self, message: str, *args):
         """Log critical message."""
-        self.logger.critical(message)
+        self.logger.critical(message, *args)
+
+    def isEnabledFor(self, level: int) -> bool:
+        """True if messages at this level would be emitted.
+
+        Lets callers skip work done purely to build log output (e.g.
+        loops that only produce debug lines).
+        """
+        return self.logger.isEnabledFor(level)
     
     def start_timer(self, operation: str):
         """Start a timer for an operation.
@@ -112,25 +112,29 @@ class SkillComparator:
         return False
     
     def find_matching_skills(
-        self, 
-        resume_skills: List[str], 
-        job_skills: List[str]
+        self,
+        resume_skills: List[str],
+        job_skills: List[str],
+        resume_skills_normalized: List[str] = None
     ) -> Tuple[List[str], List[str]]:
         """
         Find matched and missing skills.
-        
+
         Args:
             resume_skills: Skills from candidate's resume
             job_skills: Skills required by job posting
-            
+            resume_skills_normalized: Optional pre-normalized resume skills
+                (computed once by the caller to avoid re-normalizing per role)
+
         Returns:
             Tuple of (matched_skills, missing_skills)
         """
         matched = []
         missing = []
-        
-        # Normalize all skills
-        resume_skills_normalized = [self.normalize_skill(s) for s in resume_skills]
+
+        # Normalize all skills (unless the caller already did)
+        if resume_skills_normalized is None:
+            resume_skills_normalized = [self.normalize_skill(s) for s in resume_skills]
         
         for job_skill in job_skills:
             job_skill_norm = self.normalize_skill(job_skill)
@@ -56,16 +56,23 @@ class SkillGapAnalyzer:
         
         # Step 2: Group jobs by role
         jobs_by_role = self._group_jobs_by_role(job_postings, job_roles)
-        
+
+        # Normalize resume skills once; reused for every role comparison below
+        resume_skills_normalized = [
+            self.comparator.normalize_skill(s) for s in resume_skills
+        ]
+
         # Step 3: Analyze each role separately
         self.logger.info(f"🎯 Analyzing {len(job_roles)} job roles...")
         role_analyses = []
-        
+
         for role in job_roles:
             role_jobs = jobs_by_role.get(role, [])
             if role_jobs:
                 self.logger.info(f"   → {role}: {len(role_jobs)} jobs")
-                role_analysis = self._analyze_role(role, resume_skills, role_jobs)
+                role_analysis = self._analyze_role(
+                    role, resume_skills, role_jobs, resume_skills_normalized
+                )
                 role_analyses.append(role_analysis)
             else:
                 self.logger.warning(f"   ⚠️  {role}: No jobs found")
@@ -148,10 +155,11 @@ class SkillGapAnalyzer:
         return jobs_by_role
     
     def _analyze_role(
-        self, 
-        role: str, 
-        resume_skills: List[str], 
-        role_jobs: List[JobPosting]
+        self,
+        role: str,
+        resume_skills: List[str],
+        role_jobs: List[JobPosting],
+        resume_skills_normalized: List[str] = None
     ) -> RoleSkillAnalysis:
         """Analyze skill gap for a single job role."""
         
@@ -176,7 +184,9 @@ class SkillGapAnalyzer:
                 unique_required.append(skill)
         
         # Find matched and missing skills
-        matched, missing = self.comparator.find_matching_skills(resume_skills, unique_required)
+        matched, missing = self.comparator.find_matching_skills(
+            resume_skills, unique_required, resume_skills_normalized
+        )
         
         # Calculate match percentage
         match_pct = self.comparator.calculate_match_percentage(matched, len(unique_required))
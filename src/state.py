@@ -258,17 +258,26 @@ class SkillGapAnalysis(BaseModel):
     )
 
 
+def _last_value(current, new):
+    """Reducer for keys that parallel branches may both write (the
+    role-analysis and summary nodes run concurrently); last write wins."""
+    return new
+
+
 class AgentState(TypedDict):
     """State for the LangGraph agent."""
     messages: Annotated[list, add_messages]
     file_id: str
     file_name: str
+    file_path: Optional[str]  # Staged copy of the file, namespaced per file_id
     raw_resume_text: str
+    raw_resume_text_preview: Optional[str]  # First 3000 chars, sliced once for the summary prompt
     parsed_resume: Optional[ParsedResume]
+    parsed_resume_json: Optional[str]  # Serialized once in parse_resume, reused by LLM nodes
     job_role_matches: Optional[List[JobRoleMatch]]
     resume_summary: Optional[ResumeSummary]
-    current_step: str
-    error: Optional[str]
+    current_step: Annotated[str, _last_value]
+    error: Annotated[Optional[str], _last_value]
     job_postings: List[JobPosting]  # Jobs fetched from APIs
     skill_gap_analysis: Optional[SkillGapAnalysis]  # Complete skill gap analysis
     enable_skill_gap: bool  # Toggle to enable/disable skill gap feature
@@ -1,12 +1,58 @@
-"""Utility functions for file hashing."""
+"""Utility functions for file hashing and temp-file staging."""
 
 import hashlib
+import os
+import platform
+import tempfile
 from pathlib import Path
 from typing import Union
 
 from src.logger import get_logger
 
 
+def get_staging_dir() -> Path:
+    """Return the staging directory for downloaded resume files.
+
+    Resumes are written once and then re-read several times (hash, parse,
+    text extraction) before being deleted, so the staging area should be
+    RAM-backed where possible: /dev/shm on Linux, the system temp dir
+    elsewhere. Override with the ASCEND_TMP environment variable.
+
+    Returns:
+        Path to the staging directory (created if missing)
+    """
+    override = os.environ.get("ASCEND_TMP")
+    if override:
+        staging = Path(override)
+    elif platform.system() == "Linux" and Path("/dev/shm").is_dir():
+        staging = Path("/dev/shm/ascend")
+    else:
+        staging = Path(tempfile.gettempdir()) / "ascend"
+
+    staging.mkdir(parents=True, exist_ok=True)
+    return staging
+
+
+def staging_path(file_id: str, file_name: str) -> Path:
+    """Return the staging path for a Drive file's downloaded copy.
+
+    Namespaced by file_id so two resumes sharing a display name (every
+    candidate's 'resume.pdf') can be staged concurrently without one
+    run overwriting - or cleaning up - the other's bytes. The name is
+    reduced to its basename so it can't escape the staging dir.
+
+    Args:
+        file_id: Google Drive file ID
+        file_name: Display name of the file
+
+    Returns:
+        Path to stage the file at (parent directory created if missing)
+    """
+    path = get_staging_dir() / file_id / Path(file_name).name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 def hash_file(file_path: Union[str, Path], chunk_size: int = 65536) -> str:
     """Compute SHA256 hash of a file.
     
@@ -44,6 +90,55 @@ def hash_file(file_path: Union[str, Path], chunk_size: int = 65536) -> str:
         raise
 
 
+def quick_fingerprint(file_path: Union[str, Path]) -> str:
+    """Compute a cheap content fingerprint for cache lookups.
+
+    Combines file size with a BLAKE2b digest of the first and last 64 KB,
+    so the cache check costs O(1) I/O instead of reading a whole multi-MB
+    PDF just to discover whether Phase 1 can be skipped.
+
+    Args:
+        file_path: Path to the file to fingerprint
+
+    Returns:
+        Fingerprint string of the form "<size>-<hexdigest>"
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+    """
+    file_path = Path(file_path)
+
+    if not file_path.exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    size = file_path.stat().st_size
+
+    with open(file_path, 'rb') as f:
+        head = f.read(65536)
+        f.seek(-min(65536, size), 2)
+        tail = f.read()
+
+    return f"{size}-{hashlib.blake2b(head + tail, digest_size=16).hexdigest()}"
+
+
+def quick_fingerprint_bytes(content: bytes) -> str:
+    """Compute the same fingerprint as quick_fingerprint from in-memory bytes.
+
+    Used when the file content is already in memory (e.g. just downloaded),
+    avoiding any disk read at all.
+
+    Args:
+        content: Full file content
+
+    Returns:
+        Fingerprint string of the form "<size>-<hexdigest>"
+    """
+    size = len(content)
+    head = content[:65536]
+    tail = content[-min(65536, size):] if size else b''
+    return f"{size}-{hashlib.blake2b(head + tail, digest_size=16).hexdigest()}"
+
+
 def hash_string(text: str) -> str:
     """Compute SHA256 hash of a string.
     